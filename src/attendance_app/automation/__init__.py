@@ -10,6 +10,7 @@ from .auto_grading import (
 	AutoGradingResult,
 	AutoGradingRoutine,
 	AutoGradingSessionContext,
+	open_headless_grading,
 	run_auto_grading,
 )
 from .scraper import CourseScraper
@@ -24,6 +25,7 @@ __all__ = [
 	"AutoGradingMessage",
 	"AutoGradingResult",
 	"AutoGradingRoutine",
+	"open_headless_grading",
 	"run_auto_grading",
 	"get_bonus_student_data",
 	"open_moodle_courses",
@@ -1,17 +1,69 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
-from time import sleep
+import logging
+import re
+import sys
+from dataclasses import dataclass, field
+from html.parser import HTMLParser
 from typing import Callable, Iterable, Protocol
+from urllib.parse import parse_qs, urlencode, urlsplit
 
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
 
+try:  # pragma: no cover - optional HTTP fast path
+    import requests
+except ImportError:  # pragma: no cover - fall back to browser-only reads
+    requests = None
+
 from .chrome import ChromeRemoteController
 
 _VALID_TONES = {"info", "success", "warning", "normal"}
+_TONE_PRIORITY = {"warning": 3, "success": 2, "info": 1, "normal": 0}
+
+_MOODLE_ROOT_URL = "https://moodle.lut.fi/"
+_MOODLE_ASSIGN_VIEW_URL = "https://moodle.lut.fi/mod/assign/view.php"
+_MOODLE_HOST = "moodle.lut.fi"
+_MOODLE_ASSIGN_VIEW_PATH = "/mod/assign/view.php"
+_COOKIE_KEYS = ("name", "value", "domain", "path", "secure", "httpOnly", "expiry", "sameSite")
+
+# Fetch/POST helpers executed inside the logged-in browser tab so the session cookies are reused.
+_FETCH_TEXT_JS = (
+    "return fetch(arguments[0], {credentials: 'include'})"
+    ".then((response) => response.text());"
+)
+_POST_FORM_JS = (
+    "return fetch(arguments[0], {method: 'POST', credentials: 'include',"
+    " headers: {'Content-Type': 'application/x-www-form-urlencoded'}, body: arguments[1]})"
+    ".then((response) => ({ok: response.ok, status: response.status}));"
+)
+_SESSKEY_JS = "return (window.M && M.cfg && M.cfg.sesskey) || null;"
+_READ_SEARCH_ROW_JS = """
+const table = document.querySelector('table#submissions');
+const idnumber = table && table.querySelector('td.idnumber');
+const input = table && table.querySelector('td.grade input.quickgrade');
+return {
+    idnumber: idnumber ? idnumber.textContent.trim() : '',
+    name: input ? input.name : null,
+    value: input ? input.value : null,
+};
+"""
+_FILL_GRADE_INPUTS_JS = """
+for (const [name, value] of arguments[0]) {
+    const input = document.querySelector('input.quickgrade[name="' + name + '"]');
+    if (!input) { continue; }
+    input.value = value;
+    input.dispatchEvent(new Event('input', {bubbles: true}));
+    input.dispatchEvent(new Event('change', {bubbles: true}));
+}
+"""
+
+_QUICKGRADE_NAME_RE = re.compile(r"quickgrade_(\d+)")
+_GRADEMODIFIED_NAME_RE = re.compile(r"grademodified_(\d+)")
+
+_LOGGER = logging.getLogger(__name__)
 
 
 @dataclass(slots=True)
@@ -21,6 +73,17 @@ class AutoGradingSessionContext:
     assignment_id: str | None = None
     is_confirmed: bool | None = None
     log_callback: Callable[["AutoGradingMessage"], None] | None = None
+    fast_mode: bool = False
+    headless: bool = False
+    next_student_id: str | None = None
+    prefetched_tab_handle: str | None = None
+    prefetched_student_id: str | None = None
+    owned_tab_handle: str | None = None
+    grading_base_url: str | None = None
+    sesskey: str | None = None
+    header_text: str | None = None
+    cookies: tuple | None = None
+    http_session: "requests.Session | None" = None
 
     def ensure_assignment_id(self, new_id: str) -> str:
         if self.assignment_id is None:
@@ -36,25 +99,56 @@ class AutoGradingSessionContext:
             self.is_confirmed = bool(self.prompt_callback(message))
         return bool(self.is_confirmed)
 
-@dataclass(slots=True)
+    def ensure_grading_page(self, driver) -> str:
+        """Open the assignment grading page once and cache the state derived from it."""
+        if self.grading_base_url is not None:
+            return self.header_text or ""
+        if self.assignment_id is None:
+            raise RuntimeError("Assignment id must be known before opening the grading page.")
+
+        grading_base_url = f"{_MOODLE_ASSIGN_VIEW_URL}?id={self.assignment_id}&action=grading"
+        driver.get(f"{grading_base_url}&quickgrading=1")
+        page_header = WebDriverWait(driver, 10).until(
+            EC.presence_of_element_located((By.CSS_SELECTOR, "div.page-header-headings"))
+        )
+        self.header_text = page_header.find_element(By.TAG_NAME, "h1").text if page_header else ""
+        try:
+            self.sesskey = driver.execute_script(_SESSKEY_JS)
+        except Exception:  # pragma: no cover - guard Selenium failures
+            self.sesskey = None
+        self.cookies = tuple(driver.get_cookies())
+        self.http_session = _build_http_session(self.cookies)
+        self.grading_base_url = grading_base_url
+        return self.header_text
+
+
+@dataclass(slots=True, frozen=True)
 class AutoGradingMessage:
 
     text: str
     tone: str = "info"
 
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "tone", sys.intern((self.tone or "info").lower()))
+
     def normalized_tone(self) -> str:
-        tone = (self.tone or "info").lower()
-        if tone not in _VALID_TONES:
-            return "info"
-        return tone
+        return self.tone if self.tone in _VALID_TONES else "info"
 
 
-@dataclass(slots=True)
+_NO_MESSAGES: tuple[AutoGradingMessage, ...] = ()
+_MSG_WRONG_PAGE = AutoGradingMessage(
+    "Expected Moodle grading page. Please go to 'All Submissions' grading page.", "warning"
+)
+_MSG_CONFIRMATION_DECLINED = AutoGradingMessage("Auto-grading stopped because confirmation was declined.", "warning")
+
+
+@dataclass(slots=True, frozen=True)
 class AutoGradingResult:
 
     success: bool
-    messages: tuple[AutoGradingMessage, ...] = ()
+    messages: tuple[AutoGradingMessage, ...] = _NO_MESSAGES
     should_stop: bool = False
+    dominant: str | None = None
 
     def __bool__(self) -> bool:  # pragma: no cover - boolean contract is critical
         return self.success
@@ -93,24 +187,26 @@ class AutoGradingResult:
     def ensure(value: "AutoGradingResult | bool | None") -> "AutoGradingResult":
         if isinstance(value, AutoGradingResult):
             return value
-        return AutoGradingResult(bool(value), () if value else ())
+        return AutoGradingResult(bool(value), _NO_MESSAGES)
 
     @staticmethod
     def _coerce_messages(
         messages: AutoGradingMessage | str | Iterable[AutoGradingMessage | str] | None,
         default_tone: str,
     ) -> tuple[AutoGradingMessage, ...]:
-        if messages is None:
-            return ()
+        if messages is None or messages is _NO_MESSAGES:
+            return _NO_MESSAGES
+        if isinstance(messages, tuple) and all(type(item) is AutoGradingMessage for item in messages):
+            return messages
         if isinstance(messages, AutoGradingMessage):
-            return (AutoGradingMessage(messages.text, messages.tone),)
+            return (messages,)
         if isinstance(messages, str):
             return (AutoGradingMessage(messages, default_tone),)
 
         normalized: list[AutoGradingMessage] = []
         for item in messages:
             if isinstance(item, AutoGradingMessage):
-                normalized.append(AutoGradingMessage(item.text, item.tone))
+                normalized.append(item)
             else:
                 normalized.append(AutoGradingMessage(str(item), default_tone))
         return tuple(normalized)
@@ -119,10 +215,11 @@ class AutoGradingResult:
         return "\n".join(message.text for message in self.messages if message.text and message.text.strip())
 
     def dominant_tone(self) -> str:
+        if self.dominant is not None:
+            return self.dominant
         if not self.messages:
             return "success" if self.success else "warning"
-        priority = {"warning": 3, "success": 2, "info": 1, "normal": 0}
-        return max((msg.normalized_tone() for msg in self.messages), key=lambda tone: priority.get(tone, 0))
+        return max((msg.normalized_tone() for msg in self.messages), key=_TONE_PRIORITY.__getitem__)
 
 
 class AutoGradingRoutine(Protocol):
@@ -137,80 +234,105 @@ class AutoGradingRoutine(Protocol):
     ) -> AutoGradingResult | bool:
         """Perform Selenium-driven grading for a single student."""
 
-# https://moodle.lut.fi/mod/assign/view.php?id=1835503&action=grading
-# https://moodle.lut.fi/mod/assign/view.php?id=1835503&action=grading&search=003294855&userid=2277828
 
-def run_auto_grading(
-    controller: ChromeRemoteController,
-    student_name: str,
-    student_id: str,
-    total_points: int,
-    auto_save: bool,
-    context: AutoGradingSessionContext,
-) -> AutoGradingResult:
-    messages: list[AutoGradingMessage] = []
+def _prefetch_next_student(driver, context: AutoGradingSessionContext) -> None:
+    next_student_id = context.next_student_id
+    if not next_student_id or context.prefetched_tab_handle is not None:
+        return
+    try:
+        # A background target keeps focus on the current tab and, unlike window.open without
+        # a user gesture, is not subject to the popup blocker. Its target id is the window handle.
+        created = driver.execute_cdp_cmd(
+            "Target.createTarget",
+            {"url": f"{context.grading_base_url}&search={next_student_id}", "background": True},
+        )
+    except Exception:  # pragma: no cover - prefetching is best effort
+        return
+    handle = (created or {}).get("targetId")
+    if handle:
+        context.prefetched_tab_handle = handle
+        context.prefetched_student_id = next_student_id
+
+
+def _close_prefetched_tab(driver, context: AutoGradingSessionContext) -> None:
+    handle = context.prefetched_tab_handle
+    context.prefetched_tab_handle = None
+    context.prefetched_student_id = None
+    if handle is None:
+        return
+    try:
+        current_handle = driver.current_window_handle
+        driver.switch_to.window(handle)
+        driver.close()
+        driver.switch_to.window(current_handle)
+    except Exception:  # pragma: no cover - prefetching is best effort
+        pass
+
+
+def _adopt_prefetched_tab(driver, context: AutoGradingSessionContext, student_id: str) -> bool:
+    """Switch to the tab prefetched for ``student_id``; stale prefetched tabs are closed.
+
+    Only tabs this module opened are closed when moving on; the user's own tab stays open.
+    """
+
+    handle = context.prefetched_tab_handle
+    if handle is None:
+        return False
+    if context.prefetched_student_id != student_id:
+        _close_prefetched_tab(driver, context)
+        return False
+    context.prefetched_tab_handle = None
+    context.prefetched_student_id = None
+    try:
+        if context.owned_tab_handle is not None and driver.current_window_handle == context.owned_tab_handle:
+            driver.close()
+        driver.switch_to.window(handle)
+    except Exception:  # pragma: no cover - prefetching is best effort
+        return False
+    context.owned_tab_handle = handle
+    return True
 
-    def log(text: str, tone: str = "info") -> None:
-        cleaned = (text or "").strip()
-        if not cleaned:
-            return
-        message = AutoGradingMessage(cleaned, tone)
-        messages.append(message)
-        if context.log_callback is not None:
-            try:
-                context.log_callback(message)
-            except Exception:  # pragma: no cover - log callbacks must not break automation
-                pass
 
-    try:
-        driver = controller.open_browser()
-    except Exception as exc:  # pragma: no cover - guard Selenium failures
-        log(f"Failed to open browser session: {exc}", "warning")
-        return AutoGradingResult(False, tuple(messages), should_stop=True)
-
-    assignment_id = context.assignment_id
-    if assignment_id is None:
-        url_testers = [
-            "&action=grading",
-            "moodle.lut.fi/mod/assign/view.php",
-            "id=",
-        ]
-        current_url = driver.current_url or ""
-        
-        for tester in url_testers:
-            if tester not in current_url:
-                log("Expected Moodle grading page. Please go to 'All Submissions' grading page.", "warning")
-                return AutoGradingResult(False, tuple(messages), should_stop=True)
+def _document_ready(driver) -> bool:
+    return driver.execute_script("return document.readyState") == "complete"
 
-        # extract id= value from url (example): https://moodle.lut.fi/mod/assign/view.php?id=1835503&action=grading
-        try:
-            id_value = current_url.split("id=")[1].split("&")[0]
-        except (IndexError, AttributeError):  # pragma: no cover - defensive coding
-            id_value = ""
+
+def _prepare_grading_page(
+    driver,
+    context: AutoGradingSessionContext,
+    log: Callable[..., None],
+) -> tuple[bool, bool]:
+    """Resolve the assignment and confirm the grading page; returns ``(ready, should_stop)``."""
+
+    if context.assignment_id is None:
+        # e.g. https://moodle.lut.fi/mod/assign/view.php?id=1835503&action=grading
+        current_url = driver.current_url or ""
+        url_parts = urlsplit(current_url)
+        query_params = parse_qs(url_parts.query)
+        if (
+            url_parts.netloc != _MOODLE_HOST
+            or url_parts.path != _MOODLE_ASSIGN_VIEW_PATH
+            or query_params.get("action") != ["grading"]
+        ):
+            log(_MSG_WRONG_PAGE)
+            return False, True
+        id_value = (query_params.get("id") or [""])[0]
         if not id_value.isdigit():
             log(f"Failed to extract a numeric 'id' from URL: {current_url}", "warning")
-            return AutoGradingResult(False, tuple(messages), should_stop=True)
+            return False, True
         try:
-            assignment_id = context.ensure_assignment_id(id_value)
+            context.ensure_assignment_id(id_value)
         except ValueError as exc:
             log(str(exc), "warning")
-            return AutoGradingResult(False, tuple(messages), should_stop=True)
+            return False, True
 
-    grading_url = f"https://moodle.lut.fi/mod/assign/view.php?id={assignment_id}&action=grading&quickgrading=1"
-    search_url = f"https://moodle.lut.fi/mod/assign/view.php?id={assignment_id}&action=grading&search={student_id}"
-    
     is_confirmed = context.is_confirmed
     if is_confirmed is None:
         try:
-            driver.get(grading_url)
-            page_header = WebDriverWait(driver, 10).until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, "div.page-header-headings"))
-            )
+            header_text = context.ensure_grading_page(driver)
         except Exception as exc:  # pragma: no cover - guard Selenium failures
             log(f"Failed to navigate to grading page: {exc}", "warning")
-            return AutoGradingResult(False, tuple(messages), should_stop=False)
-        
-        header_text = page_header.find_element(By.TAG_NAME, "h1").text if page_header else ""
+            return False, False
 
         confirmation_message = (
             f"Is this the correct grading page for correct chapter?:\n'{header_text}'\n"
@@ -220,32 +342,89 @@ def run_auto_grading(
             is_confirmed = context.ensure_confirmation(confirmation_message)
         except RuntimeError as exc:
             log(str(exc), "warning")
-            return AutoGradingResult(False, tuple(messages), should_stop=True)
+            return False, True
 
     if not is_confirmed:
-        log("Auto-grading stopped because confirmation was declined.", "warning")
-        return AutoGradingResult(False, tuple(messages), should_stop=True)
+        log(_MSG_CONFIRMATION_DECLINED)
+        return False, True
+    return True, False
+
+
+# https://moodle.lut.fi/mod/assign/view.php?id=1835503&action=grading
+# https://moodle.lut.fi/mod/assign/view.php?id=1835503&action=grading&search=003294855&userid=2277828
+
+def run_auto_grading(
+    controller: ChromeRemoteController,
+    student_name: str,
+    student_id: str,
+    total_points: int,
+    auto_save: bool,
+    context: AutoGradingSessionContext,
+) -> AutoGradingResult:
+    messages: list[AutoGradingMessage] = []
+    dominant: str | None = None
+    dominant_priority = -1
+
+    def log(text: str | AutoGradingMessage, tone: str = "info") -> None:
+        nonlocal dominant, dominant_priority
+        if isinstance(text, AutoGradingMessage):
+            message = text
+        else:
+            cleaned = (text or "").strip()
+            if not cleaned:
+                return
+            message = AutoGradingMessage(cleaned, tone)
+        messages.append(message)
+        message_tone = message.normalized_tone()
+        priority = _TONE_PRIORITY[message_tone]
+        if priority > dominant_priority:
+            dominant, dominant_priority = message_tone, priority
+        if context.log_callback is not None:
+            try:
+                context.log_callback(message)
+            except Exception:  # pragma: no cover - log callbacks must not break automation
+                pass
+
+    def finish(success: bool, *, should_stop: bool = False) -> AutoGradingResult:
+        return AutoGradingResult(success, tuple(messages), should_stop=should_stop, dominant=dominant)
+
+    try:
+        driver = controller.open_browser()
+    except Exception as exc:  # pragma: no cover - guard Selenium failures
+        log(f"Failed to open browser session: {exc}", "warning")
+        return finish(False, should_stop=True)
+
+    ready, should_stop = _prepare_grading_page(driver, context, log)
+    if not ready:
+        return finish(False, should_stop=should_stop)
 
     log(
         f"Finding student...\nStudent ID: {student_id},\nName: {student_name}",
         "info",
     )
 
+    search_url = f"{context.grading_base_url}&search={student_id}"
+    header_text = context.header_text or ""
+
+    if context.fast_mode and auto_save and context.sesskey:
+        success = _quickgrade_in_place(driver, context, student_name, student_id, total_points, search_url, log)
+        return finish(success)
+
     try:
-        driver.get(search_url)
-        page_header = WebDriverWait(driver, 10).until(
-            EC.presence_of_element_located((By.CSS_SELECTOR, "div.page-header-headings"))
-        )
-        header_text = page_header.find_element(By.TAG_NAME, "h1").text if page_header else ""
-        # Wait for the search results to load table with id="submissions"
-        results_table = WebDriverWait(driver, 20).until(
-            EC.presence_of_element_located((By.CSS_SELECTOR, "table#submissions"))
+        if not _adopt_prefetched_tab(driver, context, student_id):
+            driver.get(search_url)
+        # Wait for the page header and the search results table with id="submissions"
+        _, results_table = WebDriverWait(driver, 20, poll_frequency=0.2).until(
+            EC.all_of(
+                EC.presence_of_element_located((By.CSS_SELECTOR, "div.page-header-headings")),
+                EC.presence_of_element_located((By.CSS_SELECTOR, "table#submissions")),
+            )
         )
         # scroll to results_table
         driver.execute_script("arguments[0].scrollIntoView();", results_table)
     except Exception as exc:  
         log(f"Failed to search for student {student_id}: {exc}", "warning")
-        return AutoGradingResult(False, tuple(messages), should_stop=False)
+        return finish(False)
 
     log(
         f"Found grading page for student ID '{student_id}': {header_text}",
@@ -253,43 +432,28 @@ def run_auto_grading(
     )
 
     try:
-        result_id_number = results_table.find_element(By.CSS_SELECTOR, "td.idnumber").text.strip()
-        if student_id not in result_id_number:
-            log(f"Student ID '{student_id}' does not match the search results.", "warning")
-            return AutoGradingResult(False, tuple(messages), should_stop=False)
-    except Exception:  
-        log(f"Student ID '{student_id}' not found in search results.", "warning")
-        return AutoGradingResult(False, tuple(messages), should_stop=False)
-    
-    try:
-        grade_cell = results_table.find_element(By.CSS_SELECTOR, "td.grade")
-        grade_input = grade_cell.find_element(By.CSS_SELECTOR, "input[type='text'][class='quickgrade']")
-    except Exception:  
-        log(f"Failed to find grade input grading cell for student ID '{student_id}'.", "warning")
-        return AutoGradingResult(False, tuple(messages), should_stop=False)
-    
+        row_state = driver.execute_script(_READ_SEARCH_ROW_JS) or {}
+    except Exception:
+        row_state = {}
+    if not _check_search_row(
+        student_id,
+        (row_state.get("idnumber") or "").strip(),
+        bool(row_state.get("name")),
+        row_state.get("value") or "",
+        log,
+    ):
+        return finish(False)
+
     try:
-        # get current value
-        current_value = grade_input.get_attribute("value")
-        # check if the cell is empty or not
-        if current_value and current_value.strip():
-            log(
-                f"Grade input for student ID '{student_id}' is not empty (current value: '{current_value}'). Skipping entry.",
-                "warning",
-            )
-            sleep(1)
-            return AutoGradingResult(False, tuple(messages), should_stop=False)
-        
-        grade_input.clear()
-        grade_input.send_keys(str(total_points))
+        driver.execute_script(_FILL_GRADE_INPUTS_JS, [(row_state["name"], str(total_points))])
         log(
             f"Entered grade {total_points} for student ID '{student_id}'. Waiting to save...",
             "info",
         )
-    except Exception:  
+    except Exception:
         log(f"Failed to enter grade for student ID '{student_id}'.", "warning")
-        return AutoGradingResult(False, tuple(messages), should_stop=False)
-    
+        return finish(False)
+
     if auto_save:
         try:
             save_button_region = driver.find_element(By.CSS_SELECTOR, "div[data-region='quick-grading-save']")
@@ -300,7 +464,7 @@ def run_auto_grading(
                     f"Could not find a 'Save' button to auto-save grade for student ID '{student_id}'.",
                     "warning",
                 )
-                return AutoGradingResult(False, tuple(messages), should_stop=False)
+                return finish(False)
             
 
             current_url = driver.current_url
@@ -315,17 +479,17 @@ def run_auto_grading(
                     f"Timed out waiting for user to save after entering grade for student ID '{student_id}'.",
                     "warning",
                 )
-                return AutoGradingResult(False, tuple(messages), should_stop=False)
-            
-            sleep(1)  
+                return finish(False)
 
             log(
                 f"Auto-saved grade for student ID '{student_id}'",
                 "info",
             )
+            # Start loading the next student's search page while this one finishes up.
+            _prefetch_next_student(driver, context)
         except Exception:  
             log(f"Failed to auto-save grade for student ID '{student_id}'.", "warning")
-            return AutoGradingResult(False, tuple(messages), should_stop=False)
+            return finish(False)
     else:
         log(
             f"Grade entry for student ID '{student_id}' is ready. Please save manually.",
@@ -340,14 +504,242 @@ def run_auto_grading(
                 f"Timed out waiting for user to save after entering grade for student ID '{student_id}'.",
                 "warning",
             )
-            return AutoGradingResult(False, tuple(messages), should_stop=False)
+            return finish(False)
 
-    sleep(1)
+    try:
+        WebDriverWait(driver, 10).until(_document_ready)
+    except TimeoutException:
+        pass
     log(
         f"{header_text} | Grading completed\n{student_name} | {student_id}\nTotal Points: {total_points}",
         "success",
     )
-    return AutoGradingResult(True, tuple(messages), should_stop=False)
+    return finish(True)
+
+
+def open_headless_grading(
+    controller: ChromeRemoteController,
+    context: AutoGradingSessionContext,
+) -> ChromeRemoteController:
+    """Open the confirmed grading page in a headless companion of ``controller``.
+
+    The companion gets the cookies captured from the user's browser, so it shares the
+    Moodle login; the user's own tab is left where it is. Callers own the returned
+    controller and must shut it down.
+    """
+
+    if not context.is_confirmed or context.grading_base_url is None:
+        raise RuntimeError("Headless grading can only start after the grading page is confirmed.")
+
+    _close_prefetched_tab(controller.open_browser(), context)
+    context.owned_tab_handle = None
+    companion = controller.headless_companion()
+    try:
+        driver = companion.open_browser()
+        driver.get(_MOODLE_ROOT_URL)
+        for cookie in context.cookies or ():
+            try:
+                driver.add_cookie({key: cookie[key] for key in _COOKIE_KEYS if key in cookie})
+            except Exception:  # pragma: no cover - cookies for other domains are skipped
+                pass
+        driver.get(f"{context.grading_base_url}&quickgrading=1")
+        # The submissions table is only rendered for a logged-in grader.
+        WebDriverWait(driver, 20).until(
+            EC.presence_of_element_located((By.CSS_SELECTOR, "table#submissions"))
+        )
+    except Exception:
+        companion.shutdown()
+        raise
+    return companion
+
+
+def _build_http_session(cookies: Iterable[dict]) -> "requests.Session | None":
+    if requests is None:
+        return None
+    session = requests.Session()
+    session.mount("https://", requests.adapters.HTTPAdapter(pool_connections=1, pool_maxsize=4))
+    for cookie in cookies:
+        session.cookies.set(
+            cookie["name"],
+            cookie["value"],
+            domain=cookie.get("domain"),
+            path=cookie.get("path", "/"),
+        )
+    return session
+
+
+def _fetch_search_html(driver, context: AutoGradingSessionContext, search_url: str) -> str | None:
+    """Fetch the grading search page over HTTP, falling back to a fetch inside ``driver``."""
+
+    if context.http_session is not None:
+        try:
+            response = context.http_session.get(search_url, timeout=15)
+            if response.ok:
+                return response.text
+        except Exception:  # pragma: no cover - network hiccups fall back to the browser
+            pass
+    try:
+        return driver.execute_script(_FETCH_TEXT_JS, search_url) or ""
+    except Exception:  # pragma: no cover - guard Selenium failures
+        return None
+
+
+@dataclass(slots=True)
+class _SearchRow:
+
+    idnumber: str = ""
+    user_id: str | None = None
+    current_value: str = ""
+    grade_modified: dict[str, str] = field(default_factory=dict)
+
+
+class _SearchRowParser(HTMLParser):
+    """Reads the first idnumber cell and quick-grade input out of an assignment search page."""
+
+    def __init__(self) -> None:
+        super().__init__(convert_charrefs=True)
+        self.row = _SearchRow()
+        self._idnumber_depth = 0
+        self._idnumber_done = False
+        self._idnumber_parts: list[str] = []
+
+    def handle_starttag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
+        attributes = dict(attrs)
+        if tag == "td":
+            # Count nested cells so only the idnumber cell's own </td> closes it.
+            if self._idnumber_depth:
+                self._idnumber_depth += 1
+            elif not self._idnumber_done and "idnumber" in (attributes.get("class") or "").split():
+                self._idnumber_depth = 1
+        elif tag == "input":
+            name = attributes.get("name") or ""
+            value = attributes.get("value") or ""
+            quickgrade_match = _QUICKGRADE_NAME_RE.fullmatch(name)
+            if quickgrade_match is not None and self.row.user_id is None:
+                self.row.user_id = quickgrade_match.group(1)
+                self.row.current_value = value
+            modified_match = _GRADEMODIFIED_NAME_RE.fullmatch(name)
+            if modified_match is not None:
+                self.row.grade_modified[modified_match.group(1)] = value
+
+    def handle_endtag(self, tag: str) -> None:
+        if tag != "td" or not self._idnumber_depth:
+            return
+        self._idnumber_depth -= 1
+        if not self._idnumber_depth:
+            self.row.idnumber = " ".join("".join(self._idnumber_parts).split())
+            self._idnumber_done = True
+
+    def handle_data(self, data: str) -> None:
+        if self._idnumber_depth:
+            self._idnumber_parts.append(data)
+
+
+def _parse_search_html(html: str) -> _SearchRow:
+    parser = _SearchRowParser()
+    parser.feed(html)
+    parser.close()
+    return parser.row
+
+
+def _check_search_row(
+    student_id: str,
+    idnumber: str,
+    has_grade_input: bool,
+    current_value: str,
+    log: Callable[[str, str], None],
+) -> bool:
+    if not idnumber:
+        log(f"Student ID '{student_id}' not found in search results.", "warning")
+        return False
+    if student_id not in idnumber:
+        log(f"Student ID '{student_id}' does not match the search results.", "warning")
+        return False
+    if not has_grade_input:
+        log(f"Failed to find grade input grading cell for student ID '{student_id}'.", "warning")
+        return False
+    if current_value.strip():
+        log(
+            f"Grade input for student ID '{student_id}' is not empty (current value: '{current_value}'). Skipping entry.",
+            "warning",
+        )
+        return False
+    return True
+
+
+def _grade_matches(value: str, total_points: int) -> bool:
+    try:
+        return float(value.strip().replace(",", ".")) == float(total_points)
+    except ValueError:
+        return False
+
+
+def _quickgrade_in_place(
+    driver,
+    context: AutoGradingSessionContext,
+    student_name: str,
+    student_id: str,
+    total_points: int,
+    search_url: str,
+    log: Callable[[str, str], None],
+) -> bool:
+    """Grade one student through Moodle's quick-grading form without navigating the tab."""
+
+    html = _fetch_search_html(driver, context, search_url)
+    if html is None:
+        log(f"Failed to search for student {student_id}.", "warning")
+        return False
+
+    row = _parse_search_html(html)
+    if not row.idnumber or row.user_id is None:
+        _LOGGER.warning(
+            "Quick-grade search page for student ID %s has no idnumber cell or grade input (%d bytes).",
+            student_id,
+            len(html),
+        )
+    if not _check_search_row(student_id, row.idnumber, row.user_id is not None, row.current_value, log):
+        return False
+
+    user_id = row.user_id
+
+    form = {
+        "id": context.assignment_id or "",
+        "action": "quickgrade",
+        "sesskey": context.sesskey or "",
+        f"quickgrade_{user_id}": str(total_points),
+    }
+    grade_modified = row.grade_modified.get(user_id)
+    if grade_modified is not None:
+        form[f"grademodified_{user_id}"] = grade_modified
+
+    try:
+        response = driver.execute_script(_POST_FORM_JS, _MOODLE_ASSIGN_VIEW_URL, urlencode(form)) or {}
+    except Exception as exc:
+        log(f"Failed to auto-save grade for student ID '{student_id}': {exc}", "warning")
+        return False
+    if not response.get("ok"):
+        log(
+            f"Moodle rejected the grade for student ID '{student_id}' (HTTP {response.get('status')}).",
+            "warning",
+        )
+        return False
+
+    # Moodle answers 200 even when it refuses a quick-grade (stale grademodified, a lock,
+    # an invalid value), so read the row back to confirm the grade was stored.
+    saved_html = _fetch_search_html(driver, context, search_url)
+    saved_value = _parse_search_html(saved_html).current_value if saved_html is not None else ""
+    if not _grade_matches(saved_value, total_points):
+        log(
+            f"Moodle did not store the grade for student ID '{student_id}' (current value: '{saved_value}').",
+            "warning",
+        )
+        return False
+
+    log(
+        f"{context.header_text or ''} | Grading completed\n{student_name} | {student_id}\nTotal Points: {total_points}",
+        "success",
+    )
+    return True
 
 
 __all__ = [
@@ -355,6 +747,7 @@ __all__ = [
     "AutoGradingMessage",
     "AutoGradingResult",
     "AutoGradingRoutine",
+    "open_headless_grading",
     "run_auto_grading",
 ]
 
@@ -2,9 +2,6 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from typing import Any, Callable, Mapping, Optional
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
 
 from attendance_app.automation.chrome import ChromeRemoteController
@@ -55,12 +52,63 @@ class BonusAutomationResult:
     def formatted_lines(self) -> list[str]:
         lines = [self.summary]
         if self.details:
-            lines.extend(detail.strip() for detail in self.details.splitlines() if detail.strip())
+            lines.extend(filter(None, map(str.strip, self.details.splitlines())))
         return lines
 
 
 BonusAutomationHandler = Callable[[ChromeRemoteController], BonusAutomationResult]
 
+# "codegra" covers codegra.de / codegrade.com URLs as well as "CodeGrade" page titles.
+_CODEGRADE_KEYWORDS = ("codegra",)
+
+
+# Polls the CodeGrade submission page in the browser and resolves once the header and file
+# menu are present (or the time budget in arguments[0] runs out with at least the selector).
+_SUBMISSION_WAIT_MS = 10_000
+_READ_SUBMISSION_JS = """
+const budget = arguments[0];
+const done = arguments[arguments.length - 1];
+const started = Date.now();
+const text = (element) => element.textContent.replace(/\\s+/g, ' ').trim();
+const read = () => {
+    if (!document.querySelector('[data-cy="submission-selector-btn"]')) { return null; }
+    const name = document.querySelector('[data-cy="submission-selector-btn"] span.name-user');
+    const user = document.querySelector('[data-cy="submission-selector-btn"] span.user');
+    const headerList = document.querySelector('[data-cy="submission-header"] ol');
+    let taskName = null;
+    for (const span of document.querySelectorAll('[data-cy="submission-header"] ol a[href*="/submissions"] span')) {
+        if (text(span)) {
+            taskName = text(span);
+            break;
+        }
+    }
+    const menu = document.querySelector('nav[aria-label="Submission menu"]');
+    const file = document.querySelector('nav[aria-label="Submission menu"] [data-orig-filename].file-label');
+    return {
+        student_name: name ? text(name) : '',
+        task_name: taskName,
+        user_line: user && user.parentElement ? text(user.parentElement) : null,
+        file_name: file ? file.getAttribute('data-orig-filename') : null,
+        complete: Boolean(headerList && menu),
+    };
+};
+const poll = () => {
+    const state = read();
+    const expired = Date.now() - started > budget;
+    if ((state && state.complete) || expired) {
+        done(state);
+    } else {
+        setTimeout(poll, 100);
+    }
+};
+poll();
+"""
+
+
+def _is_codegrade_tab(url: str, title: str) -> bool:
+    haystack = f"{url}\x00{title}".lower()
+    return any(keyword in haystack for keyword in _CODEGRADE_KEYWORDS)
+
 
 def open_moodle_courses(controller: ChromeRemoteController) -> BonusAutomationResult:
     """Navigate the remote Chrome session to the Moodle course dashboard."""
@@ -89,45 +137,24 @@ def get_bonus_student_data(controller: ChromeRemoteController) -> BonusAutomatio
     try:
         driver = controller.open_browser()
         try:
-        # Chrome DevTools Protocol to get info about all tabs
-            targets = driver.execute_cdp_cmd('Target.getTargets', {})
-            
-            tab_info = []
-            if 'targetInfos' in targets:
-                for target in targets['targetInfos']:
-                    if target.get('type') == 'page':
-                        tab_info.append({
-                            'title': target.get('title', 'Unknown'),
-                            'url': target.get('url', 'Unknown'),
-                            'targetId': target.get('targetId')
-                        })
-        except Exception as e:
+            selected_tab_id = controller.find_codegrade_tab(_is_codegrade_tab)
+        except Exception:
             return BonusAutomationResult.failure_result(
                 handler_name,
                 "Could not find CodeGrade tab via CDP. Please contact the developer.",
             )
 
-        selected_tab = None
-        for info in tab_info:
-            if "codegra" in info['url'] or "codegrade" in info['url'] or ("CodeGrade" in info['title'] and "Submission" in info['title']) or "CodeGrade" in info['title']:
-                selected_tab = info
-                break
-
-        if not selected_tab:
+        if not selected_tab_id:
             return BonusAutomationResult.failure_result(
                 handler_name,
                 "Could not find CodeGrade tab via keywords. Please contact the developer if CodeGrade is open.",
             )
-        
-        driver.switch_to.window(selected_tab['targetId'])
-        
-        submission_selector_btn = WebDriverWait(driver, 10).until(
-            EC.presence_of_element_located((By.CSS_SELECTOR, '[data-cy="submission-selector-btn"]'))
-        )
 
-        name_span = submission_selector_btn.find_element(By.CSS_SELECTOR, 'span.name-user')
+        submission = driver.execute_async_script(_READ_SUBMISSION_JS, _SUBMISSION_WAIT_MS)
+        if submission is None:
+            raise TimeoutException("Submission selector button did not appear.")
 
-        student_name = name_span.text.strip()
+        student_name = (submission.get("student_name") or "").strip()
 
         if not student_name:
             return BonusAutomationResult.failure_result(
@@ -137,31 +164,12 @@ def get_bonus_student_data(controller: ChromeRemoteController) -> BonusAutomatio
         else:
             payload={"student_name": student_name}
 
-        error_flag = False
-        try:
-            submission_header_element = WebDriverWait(driver, 10).until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, '[data-cy="submission-header"]'))
-            )
-            submission_header_ol = submission_header_element.find_element(By.CSS_SELECTOR, 'ol')    
-            submission_header_link_items = submission_header_ol.find_elements(By.CSS_SELECTOR, 'a')
-
-            for item in submission_header_link_items:
-                href = item.get_attribute('href')
-                if href and "/submissions" in href:
-                    item_span = item.find_element(By.CSS_SELECTOR, 'span')
-                    if item_span and item_span.text.strip():
-                        task_name = item_span.text.strip()
-                        payload["task_name"] = task_name
-                        break
-        except Exception:
-            error_flag = True
-        
-        try:
-            user_span = submission_selector_btn.find_element(By.CSS_SELECTOR, 'span.user')
-
-            parent_div = user_span.find_element(By.XPATH, './..')
+        if submission.get("task_name"):
+            payload["task_name"] = submission["task_name"]
 
-            full_text = parent_div.text.strip('"').strip().split(' | ')
+        user_line = submission.get("user_line")
+        if user_line is not None:
+            full_text = user_line.strip('"').strip().split(' | ')
             try:
                 submission_time = full_text[0].strip(f"{student_name} at ") if len(full_text) > 0 else "Unknown submission time"
             except Exception:
@@ -169,22 +177,10 @@ def get_bonus_student_data(controller: ChromeRemoteController) -> BonusAutomatio
             grade_info = full_text[1] if len(full_text) > 1 else "No grade info"
             payload["submission_time"] = submission_time
             payload["grade_info"] = grade_info
-        except Exception:
-            error_flag = True
 
-        try:
-            submission_menu = WebDriverWait(driver, 5).until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, 'nav[aria-label="Submission menu"]'))
-            )
-            
-            file_elements = submission_menu.find_elements(By.CSS_SELECTOR, '[data-orig-filename].file-label')
-            
-            if file_elements:
-                original_filename = file_elements[0].get_attribute('data-orig-filename')
-                payload["file_name"] = original_filename
-        except Exception:
-            error_flag = True
-        
+        if submission.get("file_name"):
+            payload["file_name"] = submission["file_name"]
+
         return BonusAutomationResult.success_result(
             handler_name,
             f"Found student: {student_name}",
@@ -7,9 +7,11 @@ import subprocess
 import sys
 import threading
 import time
+from contextlib import contextmanager
 from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Iterator, Optional
 
 from selenium import webdriver
 from selenium.common.exceptions import WebDriverException
@@ -25,6 +27,47 @@ except ImportError as exc:  # pragma: no cover - missing dependency
 
 from attendance_app.config.settings import settings, user_settings_store
 
+_HEADLESS_PORT_OFFSET = 1
+_DRIVER_VERIFY_TTL = 2.0
+_IS_LINUX = sys.platform.startswith("linux")
+_WIN_DETACH_FLAGS = (
+    getattr(subprocess, "CREATE_NEW_PROCESS_GROUP", 0) | getattr(subprocess, "DETACHED_PROCESS", 0)
+    if os.name == "nt"
+    else 0
+)
+_BASE_CHROME_FLAGS = ("--no-first-run", "--no-default-browser-check") + (
+    ("--disable-dev-shm-usage",) if _IS_LINUX else ()
+)
+_HEADLESS_CHROME_FLAGS = ("--headless=new", "--disable-gpu", "--window-size=1920,1080") + (
+    () if _IS_LINUX else ("--disable-dev-shm-usage",)
+)
+
+
+@lru_cache(maxsize=1)
+def _discover_chrome_binary() -> Optional[Path]:
+    candidates: list[Path] = []
+    if os.name == "nt":
+        potential = [
+            Path("C:/Program Files/Google/Chrome/Application/chrome.exe"),
+            Path("C:/Program Files (x86)/Google/Chrome/Application/chrome.exe"),
+        ]
+        candidates.extend(potential)
+    else:
+        for executable in ("google-chrome", "chromium-browser", "chromium"):
+            located = shutil.which(executable)
+            if located:
+                candidates.append(Path(located))
+
+    for candidate in candidates:
+        if candidate.exists():
+            return candidate
+    return None
+
+
+@lru_cache(maxsize=1)
+def _resolved_driver_path() -> Path:
+    return Path(ChromeDriverManager().install())
+
 
 class ChromeAutomationError(RuntimeError):
     """Raised when the automated Chrome session cannot be launched."""
@@ -40,7 +83,11 @@ class ChromeRemoteController:
     _driver_path: Optional[Path] = settings.selenium_driver_path
     _driver: Optional[webdriver.Chrome] = field(init=False, default=None, repr=False)
     _chrome_process: Optional[subprocess.Popen] = field(init=False, default=None, repr=False)
-    _lock: threading.Lock = field(init=False, default_factory=threading.Lock, repr=False)
+    _lock: threading.RLock = field(init=False, default_factory=threading.RLock, repr=False)
+    _session_depth: int = field(init=False, default=0, repr=False)
+    _headless: bool = False
+    _codegrade_target_id: Optional[str] = field(init=False, default=None, repr=False)
+    _driver_last_verified: float = field(init=False, default=0.0, repr=False)
 
     def __post_init__(self) -> None:  # pragma: no cover - simple path preparation
         self._user_data_dir.mkdir(parents=True, exist_ok=True)
@@ -51,7 +98,7 @@ class ChromeRemoteController:
                 if candidate.exists():
                     self._binary_path = candidate
         if self._binary_path is None:
-            self._binary_path = self._discover_chrome_binary()
+            self._binary_path = _discover_chrome_binary()
         if self._binary_path is None:
             raise ChromeAutomationError(
                 "Google Chrome executable not found. Configure the path under Settings > Chrome Binary Path."
@@ -59,10 +106,85 @@ class ChromeRemoteController:
 
     def open_browser(self) -> webdriver.Chrome:
         """Ensure the remote Chrome instance is running and return a connected WebDriver."""
+        driver = self._driver
+        if driver is not None and time.monotonic() - self._driver_last_verified < _DRIVER_VERIFY_TTL:
+            return driver
         with self._lock:
+            driver = self._driver
+            if driver is not None and self._session_depth > 0 and driver.service.is_connectable():
+                return driver
             self._ensure_remote_browser()
             return self._ensure_driver()
 
+    @contextmanager
+    def session(self) -> Iterator[webdriver.Chrome]:
+        """Keep the WebDriver connection pinned while a batch of automation steps runs.
+
+        Inside the block ``open_browser`` returns the live driver without re-verifying the
+        remote browser, so only the first step pays the connection cost.
+        """
+        driver = self.open_browser()
+        with self._lock:
+            self._session_depth += 1
+        try:
+            yield driver
+        finally:
+            with self._lock:
+                self._session_depth -= 1
+
+    def headless_companion(self) -> "ChromeRemoteController":
+        """Return a controller for a separate headless Chrome with its own port and profile.
+
+        The user's browser is left untouched; the companion starts logged out, so callers
+        must hand it the session cookies before navigating to Moodle.
+        """
+        return ChromeRemoteController(
+            _remote_port=self._remote_port + _HEADLESS_PORT_OFFSET,
+            _user_data_dir=self._user_data_dir.with_name(f"{self._user_data_dir.name}-headless"),
+            _binary_path=self._binary_path,
+            _driver_path=self._driver_path,
+            _headless=True,
+        )
+
+    def find_codegrade_tab(self, predicate: Callable[[str, str], bool]) -> Optional[str]:
+        """Switch to the page target whose ``(url, title)`` satisfies ``predicate`` and return its id.
+
+        The active tab is checked first, then the last matching target if it still matches;
+        the browser targets are only listed over CDP when neither does.
+        """
+        driver = self.open_browser()
+        try:
+            if predicate(driver.current_url, driver.title):
+                return driver.current_window_handle
+        except WebDriverException:
+            pass
+
+        cached_id = self._codegrade_target_id
+        if cached_id is not None:
+            try:
+                driver.switch_to.window(cached_id)
+                # The cached tab may have navigated away since (login redirect, user browsing).
+                if predicate(driver.current_url, driver.title):
+                    return cached_id
+            except WebDriverException:
+                pass
+            self._codegrade_target_id = None
+
+        targets = driver.execute_cdp_cmd("Target.getTargets", {})
+        target_id = next(
+            (
+                target.get("targetId")
+                for target in targets.get("targetInfos", ())
+                if target.get("type") == "page" and predicate(target.get("url", ""), target.get("title", ""))
+            ),
+            None,
+        )
+        if target_id is None:
+            return None
+        driver.switch_to.window(target_id)
+        self._codegrade_target_id = target_id
+        return target_id
+
     def is_browser_open(self) -> bool:
         """Return True if the remote debugging Chrome instance appears to be running."""
         with self._lock:
@@ -81,22 +203,20 @@ class ChromeRemoteController:
             str(self._binary_path),
             f"--remote-debugging-port={self._remote_port}",
             f"--user-data-dir={self._user_data_dir}",
-            "--no-first-run",
-            "--no-default-browser-check",
+            *_BASE_CHROME_FLAGS,
         ]
-        if sys.platform.startswith("linux"):
-            command.append("--disable-dev-shm-usage")
+        if self._headless:
+            command.extend(_HEADLESS_CHROME_FLAGS)
 
         popen_kwargs: dict = {
             "stdout": subprocess.DEVNULL,
             "stderr": subprocess.DEVNULL,
         }
-        if os.name == "nt":  # Windows
-            popen_kwargs["creationflags"] = (
-                getattr(subprocess, "CREATE_NEW_PROCESS_GROUP", 0)
-                | getattr(subprocess, "DETACHED_PROCESS", 0)
-            )
-        else:  # POSIX
+        if _WIN_DETACH_FLAGS:  # Windows
+            popen_kwargs["creationflags"] = _WIN_DETACH_FLAGS
+            popen_kwargs["close_fds"] = False
+        else:  # POSIX: a new session detaches Chrome from the controlling terminal (no SIGHUP)
+            popen_kwargs["close_fds"] = True
             popen_kwargs["start_new_session"] = True
 
         try:
@@ -105,7 +225,6 @@ class ChromeRemoteController:
             raise ChromeAutomationError(f"Chrome binary not found: {self._binary_path}") from exc
 
         self._chrome_process = process
-
         self._wait_for_port()
 
     def _ensure_driver(self) -> webdriver.Chrome:
@@ -113,6 +232,7 @@ class ChromeRemoteController:
             try:
                 # Trigger a lightweight command to verify the connection
                 self._driver.title  # type: ignore[attr-defined]
+                self._driver_last_verified = time.monotonic()
                 return self._driver
             except WebDriverException:
                 try:
@@ -126,7 +246,7 @@ class ChromeRemoteController:
             "debuggerAddress", f"localhost:{self._remote_port}"
         )
 
-        driver_path = self._driver_path or Path(ChromeDriverManager().install())
+        driver_path = self._driver_path or _resolved_driver_path()
         service = Service(str(driver_path))
 
         try:
@@ -137,6 +257,7 @@ class ChromeRemoteController:
                 "with remote debugging is still running."
             ) from exc
         self._driver = driver
+        self._driver_last_verified = time.monotonic()
         return driver
 
     def shutdown(self) -> None:
@@ -165,39 +286,21 @@ class ChromeRemoteController:
             while self._is_port_open() and time.monotonic() < deadline:
                 time.sleep(0.2)
 
-    def _is_port_open(self) -> bool:
+    def _is_port_open(self, timeout: float = 0.5) -> bool:
         try:
-            with socket.create_connection(("localhost", self._remote_port), timeout=0.5):
+            with socket.create_connection(("localhost", self._remote_port), timeout=timeout):
                 return True
         except OSError:
             return False
 
     def _wait_for_port(self, timeout: float = 10.0) -> None:
         deadline = time.monotonic() + timeout
+        delay = 0.01
         while time.monotonic() < deadline:
-            if self._is_port_open():
+            if self._is_port_open(timeout=max(delay, 0.05)):
                 return
-            time.sleep(0.2)
+            time.sleep(delay)
+            delay = min(delay * 1.5, 0.2)
         raise ChromeAutomationError(
             f"Chrome failed to open remote debugging port {self._remote_port} within {timeout} seconds."
         )
-
-    @staticmethod
-    def _discover_chrome_binary() -> Optional[Path]:
-        candidates: list[Path] = []
-        if os.name == "nt":
-            potential = [
-                Path("C:/Program Files/Google/Chrome/Application/chrome.exe"),
-                Path("C:/Program Files (x86)/Google/Chrome/Application/chrome.exe"),
-            ]
-            candidates.extend(potential)
-        else:
-            for executable in ("google-chrome", "chromium-browser", "chromium"):
-                located = shutil.which(executable)
-                if located:
-                    candidates.append(Path(located))
-
-        for candidate in candidates:
-            if candidate.exists():
-                return candidate
-        return None
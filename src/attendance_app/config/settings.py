@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import os
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 
 from dotenv import load_dotenv
@@ -19,33 +20,50 @@ user_settings_store = UserSettingsStore()
 APP_DATA_DIR = Path(user_settings_store.get("app_data_dir", str(DOCUMENTS_PATH / APP_NAME))).expanduser()
 APP_DATA_DIR.mkdir(parents=True, exist_ok=True)
 
-@dataclass(frozen=True)
+@lru_cache(maxsize=4)
+def _default_paths(app_data_dir: Path) -> tuple[Path, Path]:
+    return app_data_dir / "attendance.db", app_data_dir / "chrome-profile"
+
+
+@dataclass(frozen=True, slots=True)
 class Settings:
-    app_name: str = APP_NAME
-    database_path: Path = Path(
-        os.getenv("DATABASE_PATH", str(APP_DATA_DIR / "attendance.db"))
-    )
-    selenium_driver_path: Path | None = (
-        Path(driver_path) if (driver_path := os.getenv("SELENIUM_DRIVER_PATH")) else None
-    )
-    qr_camera_index: int = int(os.getenv("QR_CAMERA_INDEX", "0"))
-    chrome_remote_debug_port: int = int(os.getenv("CHROME_REMOTE_DEBUG_PORT", "9222"))
-    chrome_user_data_dir: Path = Path(
-        os.getenv("CHROME_USER_DATA_DIR", str(APP_DATA_DIR / "chrome-profile"))
-    )
-    chrome_binary_path: Path | None = (
-        Path(binary_path)
-        if (binary_path := os.getenv("CHROME_BINARY_PATH") or user_settings_store.get("chrome_binary_path"))
-        else None
-    )
-    default_bonus_points: int = int(
-        os.getenv("DEFAULT_BONUS_POINTS", user_settings_store.get("default_bonus_points", 2))
-    )
-    default_attendance_points: int = int(
-        os.getenv("DEFAULT_ATTENDANCE_POINTS", user_settings_store.get("default_attendance_points", 5))
-    )
-
-    def __print__(self) -> str:
+    app_name: str
+    database_path: Path
+    selenium_driver_path: Path | None
+    qr_camera_index: int
+    chrome_remote_debug_port: int
+    chrome_user_data_dir: Path
+    chrome_binary_path: Path | None
+    chrome_headless: bool
+    default_bonus_points: int
+    default_attendance_points: int
+
+    @classmethod
+    def from_env(cls, store: UserSettingsStore, app_data_dir: Path) -> "Settings":
+        """Resolve every setting once from the environment, falling back to the user store."""
+
+        getenv = os.getenv
+        default_database_path, default_chrome_profile = _default_paths(app_data_dir)
+        database_path = getenv("DATABASE_PATH")
+        chrome_profile = getenv("CHROME_USER_DATA_DIR")
+        driver_path = getenv("SELENIUM_DRIVER_PATH")
+        binary_path = getenv("CHROME_BINARY_PATH") or store.get("chrome_binary_path")
+        return cls(
+            app_name=APP_NAME,
+            database_path=Path(database_path) if database_path else default_database_path,
+            selenium_driver_path=Path(driver_path) if driver_path else None,
+            qr_camera_index=int(getenv("QR_CAMERA_INDEX", "0")),
+            chrome_remote_debug_port=int(getenv("CHROME_REMOTE_DEBUG_PORT", "9222")),
+            chrome_user_data_dir=Path(chrome_profile) if chrome_profile else default_chrome_profile,
+            chrome_binary_path=Path(binary_path) if binary_path else None,
+            chrome_headless=getenv("CHROME_HEADLESS", "0") == "1",
+            default_bonus_points=int(getenv("DEFAULT_BONUS_POINTS", store.get("default_bonus_points", 2))),
+            default_attendance_points=int(
+                getenv("DEFAULT_ATTENDANCE_POINTS", store.get("default_attendance_points", 5))
+            ),
+        )
+
+    def __str__(self) -> str:
         return (
             f"Settings(app_name={self.app_name}, "
             f"database_path={self.database_path}, "
@@ -54,11 +72,12 @@ class Settings:
             f"chrome_remote_debug_port={self.chrome_remote_debug_port}, "
             f"chrome_user_data_dir={self.chrome_user_data_dir}, "
             f"chrome_binary_path={self.chrome_binary_path}, "
+            f"chrome_headless={self.chrome_headless}, "
             f"default_bonus_points={self.default_bonus_points}, "
             f"default_attendance_points={self.default_attendance_points})"
         )
 
-settings = Settings()
+settings = Settings.from_env(user_settings_store, APP_DATA_DIR)
 
 
 def refresh_settings_from_store() -> None:
@@ -73,24 +92,4 @@ def refresh_settings_from_store() -> None:
 
     APP_DATA_DIR = app_data_dir
 
-    settings = Settings(
-        app_name=APP_NAME,
-        database_path=Path(os.getenv("DATABASE_PATH", str(APP_DATA_DIR / "attendance.db"))),
-        selenium_driver_path=settings.selenium_driver_path,
-        qr_camera_index=settings.qr_camera_index,
-        chrome_remote_debug_port=settings.chrome_remote_debug_port,
-        chrome_user_data_dir=Path(os.getenv("CHROME_USER_DATA_DIR", str(APP_DATA_DIR / "chrome-profile"))),
-        chrome_binary_path=(
-            Path(binary_path)
-            if (binary_path := os.getenv("CHROME_BINARY_PATH") or user_settings_store.get("chrome_binary_path"))
-            else None
-        ),
-        default_bonus_points=int(
-            os.getenv("DEFAULT_BONUS_POINTS", user_settings_store.get("default_bonus_points", 2))
-        ),
-        default_attendance_points=int(
-            os.getenv("DEFAULT_ATTENDANCE_POINTS", user_settings_store.get("default_attendance_points", 5))
-        ),
-    )
-
-# print(settings.__print__())
\ No newline at end of file
+    settings = Settings.from_env(user_settings_store, APP_DATA_DIR)
@@ -1,16 +1,34 @@
 from __future__ import annotations
 
 import json
+import logging
 import os
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Callable, Dict, List
+
+try:  # optional dependency: faster JSON encode/decode when installed
+	import orjson
+except ImportError:  # pragma: no cover - fall back to the standard library
+	orjson = None
 
 DEFAULT_APP_NAME = os.getenv("APP_NAME", "Queue - LUT FoP Attendance System")
 DOCUMENTS_PATH = Path(os.path.expanduser("~")) / "Documents"
 DEFAULT_POINTER_DIR = DOCUMENTS_PATH / DEFAULT_APP_NAME
 DEFAULT_SETTINGS_FILENAME = "user_settings.json"
 
+_LOGGER = logging.getLogger(__name__)
+
+
+def _dumps(data: Dict[str, Any]) -> bytes:
+	if orjson is not None:
+		return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+	return json.dumps(data, indent=2).encode("utf-8")
+
+
+_loads = orjson.loads if orjson is not None else json.loads
+
+
 DEFAULT_SETTINGS: Dict[str, Any] = {
 	"default_attendance_points": 5,
 	"default_bonus_points": 2,
@@ -28,6 +46,9 @@ class UserSettingsStore:
 	_data: Dict[str, Any] = field(init=False, default_factory=dict)
 	app_data_dir: Path = field(init=False)
 	settings_file: Path = field(init=False)
+	_mtimes: Dict[Path, int | None] = field(init=False, default_factory=dict)
+	_created_dir: Path | None = field(init=False, default=None)
+	_listeners: List[Callable[[], None]] = field(init=False, default_factory=list)
 
 	def __post_init__(self) -> None:
 		self.pointer_dir.mkdir(parents=True, exist_ok=True)
@@ -43,16 +64,26 @@ class UserSettingsStore:
 	def get(self, key: str, default: Any = None) -> Any:
 		return self._data.get(key, default)
 
+	def add_listener(self, callback: Callable[[], None]) -> None:
+		"""Call ``callback`` whenever the stored values change through reload() or update()."""
+		self._listeners.append(callback)
+
 	def reload(self) -> None:
 		pointer_path = self.pointer_dir / self.settings_filename
+		if self._data and not self._files_changed(pointer_path, self.settings_file):
+			return
+
 		pointer_data = self._load_json(pointer_path)
 
 		app_data_raw = pointer_data.get("app_data_dir") or DEFAULT_SETTINGS["app_data_dir"]
 		self.app_data_dir = Path(app_data_raw).expanduser()
-		self.app_data_dir.mkdir(parents=True, exist_ok=True)
+		self._ensure_app_data_dir()
 
 		self.settings_file = self.app_data_dir / self.settings_filename
-		file_data = self._load_json(self.settings_file)
+		if self._same_file(pointer_path, self.settings_file):
+			file_data = pointer_data
+		else:
+			file_data = self._load_json(self.settings_file)
 
 		combined = dict(DEFAULT_SETTINGS)
 		combined.update(pointer_data)
@@ -64,6 +95,8 @@ class UserSettingsStore:
 
 		combined["app_data_dir"] = str(self.app_data_dir)
 		self._data = combined
+		self._remember_mtimes(pointer_path, self.settings_file)
+		self._notify()
 
 	def update(self, **kwargs: Any) -> Dict[str, Any]:
 		new_data = dict(self._data)
@@ -81,14 +114,18 @@ class UserSettingsStore:
 			if key in DEFAULT_SETTINGS:
 				new_data[key] = value
 
+		if new_data == self._data and not app_data_dir_changed:
+			return dict(self._data)
+
 		self._data = new_data
 
 		if app_data_dir_changed:
 			self.app_data_dir = Path(self._data["app_data_dir"]).expanduser()
-			self.app_data_dir.mkdir(parents=True, exist_ok=True)
+			self._ensure_app_data_dir()
 			self.settings_file = self.app_data_dir / self.settings_filename
 
 		self._persist()
+		self._notify()
 		return dict(self._data)
 
 	# ------------------------------------------------------------------
@@ -96,20 +133,71 @@ class UserSettingsStore:
 	# ------------------------------------------------------------------
 	def _persist(self) -> None:
 		pointer_path = self.pointer_dir / self.settings_filename
-		pointer_payload = dict(self._data)
+		# Encode once and hand each file a single write; json.dump streams token by token.
+		payload = _dumps(self._data)
+
+		self._write_atomic(self.settings_file, payload)
+		# With the default layout the pointer and the settings file are the same file.
+		if not self._same_file(pointer_path, self.settings_file):
+			self._write_atomic(pointer_path, payload)
+		self._remember_mtimes(pointer_path, self.settings_file)
 
-		with pointer_path.open("w", encoding="utf-8") as handle:
-			json.dump(pointer_payload, handle, indent=2)
+	def _notify(self) -> None:
+		for callback in self._listeners:
+			callback()
 
-		with self.settings_file.open("w", encoding="utf-8") as handle:
-			json.dump(self._data, handle, indent=2)
+	def _ensure_app_data_dir(self) -> None:
+		if self._created_dir != self.app_data_dir:
+			self.app_data_dir.mkdir(parents=True, exist_ok=True)
+			self._created_dir = self.app_data_dir
+
+	def _files_changed(self, *paths: Path) -> bool:
+		return any(self._mtimes.get(path, -1) != self._mtime(path) for path in paths)
+
+	def _remember_mtimes(self, *paths: Path) -> None:
+		self._mtimes = {path: self._mtime(path) for path in paths}
+
+	@staticmethod
+	def _same_file(first: Path, second: Path) -> bool:
+		try:
+			return os.path.samefile(first, second)
+		except OSError:
+			return first == second
+
+	@staticmethod
+	def _mtime(path: Path) -> int | None:
+		try:
+			return path.stat().st_mtime_ns
+		except OSError:
+			return None
+
+	@staticmethod
+	def _write_atomic(path: Path, payload: bytes) -> None:
+		# Write beside the target and rename over it so a crash never leaves half a JSON file.
+		tmp_path = path.with_name(path.name + ".tmp")
+		tmp_path.write_bytes(payload)
+		os.replace(tmp_path, path)
 
 	@staticmethod
 	def _load_json(path: Path) -> Dict[str, Any]:
 		try:
-			if path.exists():
-				with path.open("r", encoding="utf-8") as handle:
-					return json.load(handle)
-		except Exception:
-			pass
-		return {}
+			data = path.read_bytes()
+		except FileNotFoundError:
+			return {}
+		except OSError as exc:
+			_LOGGER.warning("Could not read settings file %s: %s", path, exc)
+			return {}
+		if not data:
+			return {}
+		try:
+			loaded = _loads(data)
+		except ValueError as exc:
+			# Move the unreadable file aside so the next update() cannot overwrite the user's values.
+			backup = path.with_name(path.name + ".corrupt")
+			_LOGGER.warning("Settings file %s is not valid JSON (%s); moved it to %s", path, exc, backup)
+			try:
+				os.replace(path, backup)
+			except OSError:
+				pass
+			return {}
+		return loaded if isinstance(loaded, dict) else {}
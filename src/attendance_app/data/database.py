@@ -1,50 +1,132 @@
 from __future__ import annotations
 
+import os
 import sqlite3
-from contextlib import contextmanager
+import threading
+from contextlib import closing, contextmanager
+from functools import lru_cache
 from pathlib import Path
 from typing import Iterator
 
+# journal_mode is persisted in the database file; the rest apply per connection.
+# WAL makes a commit a single append instead of two fsyncs, and lets readers run while
+# a writer holds the lock. synchronous=NORMAL is durable enough under WAL.
+_CONNECTION_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA cache_size=-20000",
+    "PRAGMA busy_timeout=5000",
+)
+
+_CACHED_STATEMENTS = 256
+_MIGRATIONS_DIR = Path(__file__).resolve().parent / "migrations"
+
+
+@lru_cache(maxsize=1)
+def _migration_names() -> tuple[str, ...]:
+    with os.scandir(_MIGRATIONS_DIR) as entries:
+        return tuple(sorted(entry.name for entry in entries if entry.name.endswith(".sql") and entry.is_file()))
+
 
 class Database:
     def __init__(self, db_path: Path) -> None:
         self._db_path = db_path
         self._db_path.parent.mkdir(parents=True, exist_ok=True)
+        # Each thread (UI, QR scanner, automation workers) keeps its own long-lived
+        # connection; WAL lets their readers and the single writer proceed concurrently.
+        self._local = threading.local()
+        self._connections: dict[threading.Thread, sqlite3.Connection] = {}
+        self._generation = 0
+        self._lock = threading.Lock()
+        self._initialized = False
 
     @contextmanager
-    def connect(self) -> Iterator[sqlite3.Connection]:
-        connection = sqlite3.connect(self._db_path)
-        connection.row_factory = sqlite3.Row
+    def connect_write(self) -> Iterator[sqlite3.Connection]:
+        """Yield this thread's connection, committing when the outermost block exits."""
+        connection = self._thread_connection()
+        local = self._local
+        local.depth += 1
         try:
             yield connection
-            connection.commit()
+            if local.depth == 1:
+                connection.commit()
         except Exception:
-            connection.rollback()
+            if local.depth == 1:
+                connection.rollback()
             raise
         finally:
-            connection.close()
+            local.depth -= 1
+
+    # Existing callers treat connect() as the read/write entry point.
+    connect = connect_write
+
+    @contextmanager
+    def connect_read(self) -> Iterator[sqlite3.Connection]:
+        """Yield this thread's connection for SELECTs without a commit on exit."""
+        yield self._thread_connection()
+
+    def close(self) -> None:
+        """Close every thread's connection; threads reconnect lazily on next use."""
+        with self._lock:
+            for connection in self._connections.values():
+                connection.close()
+            self._connections.clear()
+            self._generation += 1
 
     def initialize(self) -> None:
-        migrations_dir = Path(__file__).resolve().parent / "migrations"
-        migration_files = sorted(migrations_dir.glob("*.sql"))
+        if self._initialized:
+            return
 
-        with self.connect() as connection:
+        # Migration scripts toggle connection-level PRAGMAs (e.g. foreign_keys), so they
+        # run on a throwaway connection rather than the shared one.
+        with self._lock, closing(self._open()) as connection, connection:
             self._ensure_migrations_table(connection)
             applied = {
                 row["name"] for row in connection.execute("SELECT name FROM schema_migrations")
             }
 
-            for migration in migration_files:
-                if migration.name in applied:
+            for name in _migration_names():
+                if name in applied:
                     continue
-                with migration.open("r", encoding="utf-8") as sql_file:
-                    sql_script = sql_file.read()
+                sql_script = (_MIGRATIONS_DIR / name).read_text(encoding="utf-8")
                 connection.executescript(sql_script)
                 connection.execute(
                     "INSERT INTO schema_migrations(name) VALUES (?)",
-                    (migration.name,),
+                    (name,),
                 )
 
+        self._initialized = True
+
+    def _thread_connection(self) -> sqlite3.Connection:
+        local = self._local
+        connection = getattr(local, "connection", None)
+        if connection is not None and local.generation == self._generation:
+            return connection
+
+        connection = self._open()
+        with self._lock:
+            # Connections of finished threads (e.g. a grading pool's workers) are released here.
+            for thread in [thread for thread in self._connections if not thread.is_alive()]:
+                self._connections.pop(thread).close()
+            self._connections[threading.current_thread()] = connection
+            local.generation = self._generation
+        local.connection = connection
+        local.depth = 0
+        return connection
+
+    def _open(self) -> sqlite3.Connection:
+        connection = sqlite3.connect(
+            self._db_path,
+            check_same_thread=False,
+            cached_statements=_CACHED_STATEMENTS,
+        )
+        connection.row_factory = sqlite3.Row
+        for pragma in _CONNECTION_PRAGMAS:
+            connection.execute(pragma)
+        return connection
+
     @staticmethod
     def _ensure_migrations_table(connection: sqlite3.Connection) -> None:
         connection.execute(
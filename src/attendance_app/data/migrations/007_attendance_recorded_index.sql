@@ -0,0 +1,8 @@
+-- Store recorded_at in SQLite's canonical "YYYY-MM-DD HH:MM:SS" form so it sorts as TEXT.
+UPDATE attendance_records
+   SET recorded_at = datetime(recorded_at)
+ WHERE datetime(recorded_at) IS NOT NULL
+   AND recorded_at <> datetime(recorded_at);
+
+CREATE INDEX IF NOT EXISTS idx_ar_session_recorded
+    ON attendance_records (session_id, recorded_at DESC, id DESC);
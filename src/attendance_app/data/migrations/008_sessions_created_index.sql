@@ -0,0 +1,2 @@
+CREATE INDEX IF NOT EXISTS idx_sessions_created_at
+    ON attendance_sessions (created_at DESC);
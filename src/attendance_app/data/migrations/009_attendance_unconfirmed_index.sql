@@ -0,0 +1,3 @@
+CREATE INDEX IF NOT EXISTS idx_ar_unconfirmed
+    ON attendance_records (session_id)
+ WHERE status <> 'confirmed';
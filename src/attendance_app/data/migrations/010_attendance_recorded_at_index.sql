@@ -0,0 +1,2 @@
+CREATE INDEX IF NOT EXISTS idx_ar_recorded
+    ON attendance_records (recorded_at DESC, id DESC);
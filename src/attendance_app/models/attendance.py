@@ -13,6 +13,9 @@ WEEKDAY_LABELS = {
     5: "Friday",
 }
 
+def _utc_now() -> datetime:
+    return datetime.now(timezone.utc)
+
 @dataclass(slots=True)
 class Student:
     student_code: str
@@ -20,6 +23,9 @@ class Student:
     last_name: Optional[str] = None
     email: Optional[str] = None
 
+    def __post_init__(self) -> None:
+        self.student_code = self.student_code.strip()
+
     @property
     def display_name(self) -> str:
         parts = [self.first_name or "", self.last_name or ""]
@@ -34,7 +40,23 @@ class AttendanceSession:
     end_hour: int
     campus_name: str
     room_code: str
-    created_at: datetime = datetime.now(timezone.utc)
+    created_at: datetime = field(default_factory=_utc_now)
+
+    def __post_init__(self) -> None:
+        self.chapter_code = self.chapter_code.strip()
+        self.campus_name = self.campus_name.strip()
+        self.room_code = self.room_code.strip()
+
+    def session_tuple(self) -> tuple[str, int, int, int, str, str]:
+        """Identity of the session as a hashable tuple, in the column order of its UNIQUE key."""
+        return (
+            self.chapter_code,
+            self.weekday_index,
+            self.start_hour,
+            self.end_hour,
+            self.campus_name,
+            self.room_code,
+        )
 
     def session_key(self) -> str:
         return (
@@ -47,7 +69,7 @@ class AttendanceRecord:
     session_id: int
     student_code: str
     student_name: Optional[str] = None
-    recorded_at: datetime = field(default_factory=datetime.now(timezone.utc))
+    recorded_at: datetime = field(default_factory=_utc_now)
     source: str = "manual"
     a_point: int = 0
     b_point: int = 0
@@ -61,6 +83,10 @@ class BonusRecord:
     b_point: int = 0
     status: str = "pending"
 
+    def __post_init__(self) -> None:
+        self.student_name = self.student_name.strip()
+        self.status = self.status.strip() if self.status else "pending"
+
 @dataclass(slots=True)
 class SessionTemplate:
     id: int
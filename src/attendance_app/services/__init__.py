@@ -1,9 +1,11 @@
-from .attendance_service import AttendanceService, DuplicateAttendanceError, DuplicateSessionError
+from .attendance_service import AttendanceService, DuplicateAttendanceError, DuplicateSessionError, RecentRow, RecentSessionRow
 from .qr_scanner import QRScanner
 
 __all__ = [
 	"AttendanceService",
 	"DuplicateSessionError",
 	"DuplicateAttendanceError",
+	"RecentRow",
+	"RecentSessionRow",
 	"QRScanner",
 ]
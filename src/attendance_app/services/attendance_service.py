@@ -2,12 +2,160 @@ from __future__ import annotations
 
 import sqlite3
 
+from collections import namedtuple
+from functools import lru_cache
 from typing import Iterable
 
 from attendance_app.data import Database
 from attendance_app.models import AttendanceSession, BonusRecord, SessionTemplate, Student
 from attendance_app.config.settings import settings, user_settings_store
 
+# Statements on the scanning hot path live at module level so every call hands sqlite3
+# the same string object and hits its statement cache without re-parsing.
+_INSERT_SESSION_SQL = """
+    INSERT INTO attendance_sessions (
+        chapter_code, weekday_index, start_hour, end_hour,
+        campus_name, room_code
+    ) VALUES (?, ?, ?, ?, ?, ?)
+    ON CONFLICT (chapter_code, weekday_index, start_hour, end_hour, campus_name, room_code) DO NOTHING
+    RETURNING id
+"""
+
+_SELECT_SESSION_ID_SQL = """
+    SELECT id FROM attendance_sessions
+     WHERE chapter_code = ?
+       AND weekday_index = ?
+       AND start_hour = ?
+       AND end_hour = ?
+       AND campus_name = ?
+       AND room_code = ?
+"""
+
+_INSERT_ATTENDANCE_SQL = """
+    INSERT INTO attendance_records (
+        session_id, student_id, student_name, source, a_point, b_point, t_point, status
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+_INSERT_ATTENDANCE_IGNORE_SQL = _INSERT_ATTENDANCE_SQL + "ON CONFLICT (session_id, student_id) DO NOTHING"
+
+_INSERT_ATTENDANCE_RETURNING_SQL = _INSERT_ATTENDANCE_IGNORE_SQL + " RETURNING id"
+
+_SELECT_SESSION_STUDENT_IDS_SQL = "SELECT student_id FROM attendance_records WHERE session_id = ?"
+
+_RECENT_ATTENDANCE_FOR_SESSION_SQL = """
+    SELECT ar.id,
+           ar.session_id,
+           ar.student_id,
+           ar.student_name,
+           ar.recorded_at,
+           ar.source,
+           ar.a_point,
+           ar.b_point,
+           ar.t_point,
+           ar.status
+      FROM attendance_records AS ar
+     WHERE ar.session_id = ?
+  ORDER BY ar.recorded_at DESC, ar.id DESC
+     LIMIT ?
+"""
+
+_INSERT_BONUS_SQL = """
+    INSERT INTO bonus_records (session_id, student_name, b_point, status)
+    VALUES (?, ?, ?, ?)
+"""
+
+_UPDATE_ATTENDANCE_RECORD_SQL = """
+    UPDATE attendance_records
+       SET status = ?,
+           a_point = ?,
+           b_point = ?,
+           t_point = ?,
+           student_name = COALESCE(?, student_name)
+     WHERE id = ?
+       AND session_id = ?
+"""
+
+RecentRow = namedtuple(
+    "RecentRow",
+    [
+        "id",
+        "session_id",
+        "student_id",
+        "student_name",
+        "recorded_at",
+        "source",
+        "a_point",
+        "b_point",
+        "t_point",
+        "status",
+        "chapter_code",
+        "campus_name",
+        "room_code",
+        "start_hour",
+        "end_hour",
+    ],
+)
+
+RecentSessionRow = namedtuple(
+    "RecentSessionRow",
+    [
+        "id",
+        "chapter_code",
+        "weekday_index",
+        "start_hour",
+        "end_hour",
+        "campus_name",
+        "room_code",
+        "created_at",
+    ],
+)
+
+
+@lru_cache(maxsize=1)
+def _point_defaults() -> tuple[int, int]:
+    """Default (attendance, bonus) points, cached until the user settings change."""
+    return (
+        int(user_settings_store.get("default_attendance_points", settings.default_attendance_points)),
+        int(user_settings_store.get("default_bonus_points", settings.default_bonus_points)),
+    )
+
+
+user_settings_store.add_listener(_point_defaults.cache_clear)
+
+
+# Status updates bind ids in fixed-size IN lists: every full chunk reuses one cached
+# statement and no statement exceeds SQLite's host-parameter limit.
+_STATUS_UPDATE_CHUNK = 500
+
+
+@lru_cache(maxsize=None)
+def _status_update_sql(table: str, count: int) -> str:
+    placeholders = ", ".join(["?"] * count)
+    return f"UPDATE {table} SET status = ? WHERE session_id = ? AND id IN ({placeholders})"
+
+
+def _update_status_by_ids(
+    connection: sqlite3.Connection,
+    table: str,
+    session_id: int,
+    ids: list[int],
+    status: str,
+) -> None:
+    full = len(ids) - len(ids) % _STATUS_UPDATE_CHUNK
+    if full:
+        connection.executemany(
+            _status_update_sql(table, _STATUS_UPDATE_CHUNK),
+            [
+                (status, session_id, *ids[start : start + _STATUS_UPDATE_CHUNK])
+                for start in range(0, full, _STATUS_UPDATE_CHUNK)
+            ],
+        )
+    if full < len(ids):
+        rest = ids[full:]
+        connection.execute(_status_update_sql(table, len(rest)), (status, session_id, *rest))
+
+
 class DuplicateSessionError(RuntimeError):
     """Raised when attempting to create a duplicate attendance session."""
 
@@ -28,50 +176,18 @@ class AttendanceService:
         self._database.initialize()
 
     def start_session(self, session: AttendanceSession) -> int:
-        with self._database.connect() as connection:
-            duplicate = connection.execute(
-                """
-                SELECT id FROM attendance_sessions
-                                WHERE chapter_code = ?
-                  AND weekday_index = ?
-                  AND start_hour = ?
-                  AND end_hour = ?
-                  AND campus_name = ?
-                  AND room_code = ?
-                """,
-                (
-                    session.chapter_code.strip(),
-                    session.weekday_index,
-                    session.start_hour,
-                    session.end_hour,
-                    session.campus_name.strip(),
-                    session.room_code.strip(),
-                ),
-            ).fetchone()
-
-            if duplicate:
-                raise DuplicateSessionError(
-                    "An attendance session with these details already exists.",
-                    session_id=int(duplicate["id"]),
-                )
-
-            cursor = connection.execute(
-                """
-                INSERT INTO attendance_sessions (
-                    chapter_code, weekday_index, start_hour, end_hour,
-                    campus_name, room_code
-                ) VALUES (?, ?, ?, ?, ?, ?)
-                """,
-                (
-                    session.chapter_code.strip(),
-                    session.weekday_index,
-                    session.start_hour,
-                    session.end_hour,
-                    session.campus_name.strip(),
-                    session.room_code.strip(),
-                ),
+        params = session.session_tuple()
+        with self._database.connect_write() as connection:
+            inserted = connection.execute(_INSERT_SESSION_SQL, params).fetchone()
+            if inserted:
+                return int(inserted["id"])
+
+            # Only the duplicate path pays for the lookup of the existing session id.
+            duplicate = connection.execute(_SELECT_SESSION_ID_SQL, params).fetchone()
+            raise DuplicateSessionError(
+                "An attendance session with these details already exists.",
+                session_id=int(duplicate["id"]) if duplicate else None,
             )
-            return int(cursor.lastrowid)
 
     def record_attendance(
         self,
@@ -84,12 +200,91 @@ class AttendanceService:
         t_point: int | None = None,
         status: str = "recorded",
     ) -> int:
-        student_identifier = student.student_code.strip()
-        student_name = student.display_name if student.display_name != student.student_code else None
-        default_attendance = int(
-            user_settings_store.get("default_attendance_points", settings.default_attendance_points)
+        row = self._attendance_row(
+            session_id,
+            student,
+            source=source,
+            a_point=a_point,
+            b_point=b_point,
+            t_point=t_point,
+            status=status,
         )
-        default_bonus = int(user_settings_store.get("default_bonus_points", settings.default_bonus_points))
+
+        with self._database.connect_write() as connection:
+            inserted = connection.execute(_INSERT_ATTENDANCE_RETURNING_SQL, row).fetchone()
+
+        if not inserted:
+            raise DuplicateAttendanceError("Student already recorded for this session.")
+        return int(inserted["id"])
+
+    def record_attendance_batch(
+        self,
+        session_id: int,
+        students: Iterable[Student],
+        *,
+        source: str = "manual",
+        a_point: int | None = None,
+        b_point: int | None = None,
+        t_point: int | None = None,
+        status: str = "recorded",
+        strict: bool = False,
+    ) -> int:
+        """Record many students in one transaction and return how many rows were inserted.
+
+        Students already logged for the session (or repeated in ``students``) are skipped,
+        unless ``strict`` is set, in which case nothing is written and
+        ``DuplicateAttendanceError`` is raised.
+        """
+        rows = [
+            self._attendance_row(
+                session_id,
+                student,
+                source=source,
+                a_point=a_point,
+                b_point=b_point,
+                t_point=t_point,
+                status=status,
+            )
+            for student in students
+        ]
+        if not rows:
+            return 0
+
+        with self._database.connect_write() as connection:
+            if strict:
+                # Name the offending student; the insert below still guards against races.
+                seen = {
+                    existing[0]
+                    for existing in connection.execute(_SELECT_SESSION_STUDENT_IDS_SQL, (session_id,))
+                }
+                for row in rows:
+                    if row[1] in seen:
+                        raise DuplicateAttendanceError(
+                            f"Student {row[1]} already recorded for this session."
+                        )
+                    seen.add(row[1])
+
+            # Conflicting rows (already recorded, e.g. by the scanner meanwhile, or repeated in
+            # ``students``) are skipped by SQLite and not counted in rowcount.
+            inserted = int(connection.executemany(_INSERT_ATTENDANCE_IGNORE_SQL, rows).rowcount)
+            if strict and inserted != len(rows):
+                raise DuplicateAttendanceError("Student already recorded for this session.")
+            return inserted
+
+    @staticmethod
+    def _attendance_row(
+        session_id: int,
+        student: Student,
+        *,
+        source: str,
+        a_point: int | None,
+        b_point: int | None,
+        t_point: int | None,
+        status: str,
+    ) -> tuple:
+        student_identifier = student.student_code
+        student_name = student.display_name if student.display_name != student_identifier else None
+        default_attendance, default_bonus = _point_defaults()
 
         a_value = int(a_point) if a_point is not None else default_attendance
         if b_point is not None:
@@ -98,34 +293,16 @@ class AttendanceService:
             b_value = default_bonus if source == "bonus" else 0
         total_value = int(t_point) if t_point is not None else a_value + b_value
         status_value = status.strip() if status else "recorded"
-
-        with self._database.connect() as connection:
-            existing = connection.execute(
-                "SELECT id FROM attendance_records WHERE session_id = ? AND student_id = ?",
-                (session_id, student_identifier),
-            ).fetchone()
-
-            if existing:
-                raise DuplicateAttendanceError("Student already recorded for this session.")
-
-            cursor = connection.execute(
-                """
-                INSERT INTO attendance_records (
-                    session_id, student_id, student_name, source, a_point, b_point, t_point, status
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                (
-                    session_id,
-                    student_identifier,
-                    student_name,
-                    source,
-                    a_value,
-                    b_value,
-                    total_value,
-                    status_value,
-                ),
-            )
-            return int(cursor.lastrowid)
+        return (
+            session_id,
+            student_identifier,
+            student_name,
+            source,
+            a_value,
+            b_value,
+            total_value,
+            status_value,
+        )
 
     def list_sessions(
         self,
@@ -133,7 +310,25 @@ class AttendanceService:
         weekday_index: int | None = None,
         start_hour: int | None = None,
         end_hour: int | None = None,
+        status: str | None = None,
     ) -> list[dict]:
+        rows = self._list_sessions_rows(
+            weekday_index=weekday_index,
+            start_hour=start_hour,
+            end_hour=end_hour,
+            status=status,
+        )
+        return [dict(row) for row in rows]
+
+    def _list_sessions_rows(
+        self,
+        *,
+        weekday_index: int | None = None,
+        start_hour: int | None = None,
+        end_hour: int | None = None,
+        status: str | None = None,
+    ) -> list[sqlite3.Row]:
+        """Same query as list_sessions, returning sqlite3.Row objects without copying them into dicts."""
         query_parts = [
             "SELECT",
             "    s.id,",
@@ -145,15 +340,30 @@ class AttendanceService:
             "    s.room_code,",
             "    s.created_at,",
             "    s.status,",
-            "    COALESCE((SELECT COUNT(*) FROM attendance_records ar WHERE ar.session_id = s.id), 0) AS attendance_count,",
-            "    COALESCE((SELECT SUM(CASE WHEN ar.status = 'confirmed' THEN 1 ELSE 0 END) FROM attendance_records ar WHERE ar.session_id = s.id), 0) AS attendance_confirmed_count,",
-            "    COALESCE((SELECT SUM(CASE WHEN ar.status = 'graded' THEN 1 ELSE 0 END) FROM attendance_records ar WHERE ar.session_id = s.id), 0) AS graded_count,",
-            "    COALESCE((SELECT COUNT(*) FROM bonus_records br WHERE br.session_id = s.id), 0) AS bonus_count,",
-            "    COALESCE((SELECT SUM(CASE WHEN br.status = 'confirmed' THEN 1 ELSE 0 END) FROM bonus_records br WHERE br.session_id = s.id), 0) AS bonus_confirmed_count",
+            "    COALESCE(ar.attendance_count, 0) AS attendance_count,",
+            "    COALESCE(ar.attendance_confirmed_count, 0) AS attendance_confirmed_count,",
+            "    COALESCE(ar.graded_count, 0) AS graded_count,",
+            "    COALESCE(br.bonus_count, 0) AS bonus_count,",
+            "    COALESCE(br.bonus_confirmed_count, 0) AS bonus_confirmed_count",
             "FROM attendance_sessions AS s",
+            "LEFT JOIN (",
+            "    SELECT session_id,",
+            "           COUNT(*) AS attendance_count,",
+            "           SUM(CASE WHEN status = 'confirmed' THEN 1 ELSE 0 END) AS attendance_confirmed_count,",
+            "           SUM(CASE WHEN status = 'graded' THEN 1 ELSE 0 END) AS graded_count",
+            "      FROM attendance_records",
+            "  GROUP BY session_id",
+            ") AS ar ON ar.session_id = s.id",
+            "LEFT JOIN (",
+            "    SELECT session_id,",
+            "           COUNT(*) AS bonus_count,",
+            "           SUM(CASE WHEN status = 'confirmed' THEN 1 ELSE 0 END) AS bonus_confirmed_count",
+            "      FROM bonus_records",
+            "  GROUP BY session_id",
+            ") AS br ON br.session_id = s.id",
         ]
 
-        params: list[int] = []
+        params: list[int | str] = []
         conditions: list[str] = []
 
         if weekday_index is not None:
@@ -164,6 +374,10 @@ class AttendanceService:
             conditions.append("s.start_hour = ? AND s.end_hour = ?")
             params.extend([start_hour, end_hour])
 
+        if status is not None:
+            conditions.append("LOWER(s.status) = ?")
+            params.append(status.lower())
+
         if conditions:
             query_parts.append("WHERE " + " AND ".join(conditions))
 
@@ -171,16 +385,16 @@ class AttendanceService:
 
         sql = "\n".join(query_parts)
 
-        with self._database.connect() as connection:
-            rows = connection.execute(sql, tuple(params)).fetchall()
-
-        return [dict(row) for row in rows]
+        with self._database.connect_read() as connection:
+            return connection.execute(sql, tuple(params)).fetchall()
 
-    def recent_sessions(self, limit: int = 10) -> list[dict]:
-        with self._database.connect() as connection:
-            rows = connection.execute(
+    def recent_sessions(self, limit: int = 10) -> list[RecentSessionRow]:
+        with self._database.connect_read() as connection:
+            cursor = connection.cursor()
+            cursor.row_factory = None
+            rows = cursor.execute(
                 """
-          SELECT id, chapter_code, weekday_index,
+                SELECT id, chapter_code, weekday_index,
                        start_hour, end_hour, campus_name, room_code, created_at
                   FROM attendance_sessions
               ORDER BY created_at DESC
@@ -188,10 +402,11 @@ class AttendanceService:
                 """,
                 (limit,),
             ).fetchall()
-            return [dict(row) for row in rows]
+
+        return list(map(RecentSessionRow._make, rows))
 
     def get_session_attendance(self, session_id: int) -> list[dict]:
-        with self._database.connect() as connection:
+        with self._database.connect_read() as connection:
             rows = connection.execute(
                 """
                 SELECT id,
@@ -212,9 +427,12 @@ class AttendanceService:
             ).fetchall()
             return [dict(row) for row in rows]
 
-    def recent_attendance_records(self, limit: int = 10) -> list[dict]:
-        with self._database.connect() as connection:
-            rows = connection.execute(
+    def recent_attendance_records(self, limit: int = 10) -> list[RecentRow]:
+        with self._database.connect_read() as connection:
+            # Plain tuples skip building a sqlite3.Row and then a dict for every record.
+            cursor = connection.cursor()
+            cursor.row_factory = None
+            rows = cursor.execute(
                 """
                 SELECT ar.id,
                        ar.session_id,
@@ -233,41 +451,29 @@ class AttendanceService:
                        s.end_hour
                   FROM attendance_records AS ar
             INNER JOIN attendance_sessions AS s ON s.id = ar.session_id
-              ORDER BY datetime(ar.recorded_at) DESC, ar.id DESC
+              ORDER BY ar.recorded_at DESC, ar.id DESC
                  LIMIT ?
                 """,
                 (limit,),
             ).fetchall()
 
-        return [dict(row) for row in rows]
+        return list(map(RecentRow._make, rows))
 
     def recent_attendance_for_session(self, session_id: int, limit: int = 10) -> list[dict]:
-        with self._database.connect() as connection:
+        with self._database.connect_read() as connection:
             rows = connection.execute(
-                """
-                SELECT ar.id,
-                       ar.session_id,
-                       ar.student_id,
-                       ar.student_name,
-                       ar.recorded_at,
-                       ar.source,
-                       ar.a_point,
-                       ar.b_point,
-                       ar.t_point,
-                       ar.status
-                  FROM attendance_records AS ar
-                 WHERE ar.session_id = ?
-              ORDER BY datetime(ar.recorded_at) DESC, ar.id DESC
-                 LIMIT ?
-                """,
+                _RECENT_ATTENDANCE_FOR_SESSION_SQL,
                 (session_id, limit),
             ).fetchall()
 
         return [dict(row) for row in rows]
 
     def list_session_templates(self) -> list[SessionTemplate]:
-        with self._database.connect() as connection:
-            rows = connection.execute(
+        with self._database.connect_read() as connection:
+            # Columns are selected in SessionTemplate field order, so tuples unpack directly.
+            cursor = connection.cursor()
+            cursor.row_factory = None
+            rows = cursor.execute(
                 """
                 SELECT id, campus_name, weekday_index, room_code, start_hour, end_hour
                   FROM session_templates
@@ -275,34 +481,20 @@ class AttendanceService:
                 """
             ).fetchall()
 
-        return [
-            SessionTemplate(
-                id=int(row["id"]),
-                campus_name=row["campus_name"],
-                weekday_index=int(row["weekday_index"]),
-                room_code=row["room_code"],
-                start_hour=int(row["start_hour"]),
-                end_hour=int(row["end_hour"]),
-            )
-            for row in rows
-        ]
+        return [SessionTemplate(*row) for row in rows]
 
     def record_bonus(
         self,
         bonus: BonusRecord,
     ) -> int:
-        cleaned_status = bonus.status.strip() if bonus.status else "pending"
-        with self._database.connect() as connection:
+        with self._database.connect_write() as connection:
             cursor = connection.execute(
-                """
-                INSERT INTO bonus_records (session_id, student_name, b_point, status)
-                VALUES (?, ?, ?, ?)
-                """,
+                _INSERT_BONUS_SQL,
                 (
                     bonus.session_id,
-                    bonus.student_name.strip(),
+                    bonus.student_name,
                     int(bonus.b_point),
-                    cleaned_status,
+                    bonus.status,
                 ),
             )
             return int(cursor.lastrowid)
@@ -322,39 +514,29 @@ class AttendanceService:
 
         sql = "".join(query)
 
-        with self._database.connect() as connection:
+        with self._database.connect_read() as connection:
             rows = connection.execute(sql, tuple(params)).fetchall()
 
         return [dict(row) for row in rows]
 
     def get_session_bonus_summary(self, session_id: int) -> list[dict]:
-        with self._database.connect() as connection:
+        with self._database.connect_read() as connection:
             rows = connection.execute(
                 """
-                                SELECT COALESCE(student_name, '') AS student_name,
-                                             SUM(b_point) AS total_bonus,
-                                             SUM(CASE WHEN status = 'confirmed' THEN b_point ELSE 0 END) AS confirmed_bonus,
-                                             COUNT(*) AS record_count,
-                                             SUM(CASE WHEN status = 'confirmed' THEN 1 ELSE 0 END) AS confirmed_count
+                SELECT COALESCE(student_name, '') AS student_name,
+                       COALESCE(SUM(b_point), 0) AS total_bonus,
+                       COALESCE(SUM(CASE WHEN status = 'confirmed' THEN b_point ELSE 0 END), 0) AS confirmed_bonus,
+                       COUNT(*) AS record_count,
+                       SUM(CASE WHEN status = 'confirmed' THEN 1 ELSE 0 END) AS confirmed_count
                   FROM bonus_records
                  WHERE session_id = ?
-                            GROUP BY COALESCE(student_name, '')
-                            ORDER BY LOWER(COALESCE(student_name, ''))
+              GROUP BY COALESCE(student_name, '')
+              ORDER BY LOWER(COALESCE(student_name, ''))
                 """,
                 (session_id,),
             ).fetchall()
-            summary: list[dict] = []
-            for row in rows:
-                summary.append(
-                    {
-                        "student_name": row["student_name"],
-                        "total_bonus": int(row["total_bonus"] or 0),
-                        "confirmed_bonus": int(row["confirmed_bonus"] or 0),
-                        "record_count": int(row["record_count"] or 0),
-                        "confirmed_count": int(row["confirmed_count"] or 0),
-                    }
-                )
-            return summary
+
+        return [dict(row) for row in rows]
 
     def update_attendance_records(
         self,
@@ -362,41 +544,27 @@ class AttendanceService:
         session_id: int,
         updates: Iterable[dict],
     ) -> None:
-        payloads = list(updates)
-        if not payloads:
+        rows: list[tuple] = []
+        for payload in updates:
+            a_point = int(payload.get("a_point", 0) or 0)
+            b_point = int(payload.get("b_point", 0) or 0)
+            t_point_raw = payload.get("t_point")
+            rows.append(
+                (
+                    str(payload.get("status", "recorded") or "recorded").strip(),
+                    a_point,
+                    b_point,
+                    int(t_point_raw) if t_point_raw is not None else a_point + b_point,
+                    payload.get("student_name"),
+                    int(payload["id"]),
+                    session_id,
+                )
+            )
+        if not rows:
             return
 
-        with self._database.connect() as connection:
-            for payload in payloads:
-                record_id = int(payload["id"])
-                status = str(payload.get("status", "recorded") or "recorded").strip()
-                a_point = int(payload.get("a_point", 0) or 0)
-                b_point = int(payload.get("b_point", 0) or 0)
-                t_point_raw = payload.get("t_point")
-                t_point = int(t_point_raw) if t_point_raw is not None else a_point + b_point
-                student_name = payload.get("student_name")
-
-                connection.execute(
-                    """
-                    UPDATE attendance_records
-                       SET status = ?,
-                           a_point = ?,
-                           b_point = ?,
-                           t_point = ?,
-                           student_name = COALESCE(?, student_name)
-                     WHERE id = ?
-                       AND session_id = ?
-                    """,
-                    (
-                        status,
-                        a_point,
-                        b_point,
-                        t_point,
-                        student_name,
-                        record_id,
-                        session_id,
-                    ),
-                )
+        with self._database.connect_write() as connection:
+            connection.executemany(_UPDATE_ATTENDANCE_RECORD_SQL, rows)
 
     def update_status_for_attendance_records(
         self,
@@ -409,15 +577,8 @@ class AttendanceService:
         if not ids:
             return
 
-        placeholders = ", ".join(["?"] * len(ids))
-        query = (
-            "UPDATE attendance_records SET status = ? WHERE session_id = ? AND id IN ("
-            + placeholders
-            + ")"
-        )
-
-        with self._database.connect() as connection:
-            connection.execute(query, (status.strip(), session_id, *ids))
+        with self._database.connect_write() as connection:
+            _update_status_by_ids(connection, "attendance_records", session_id, ids, status.strip())
 
     def update_bonus_status_for_session(
         self,
@@ -430,19 +591,12 @@ class AttendanceService:
         if not ids:
             return
 
-        placeholders = ", ".join(["?"] * len(ids))
-        query = (
-            "UPDATE bonus_records SET status = ? WHERE session_id = ? AND id IN ("
-            + placeholders
-            + ")"
-        )
-
-        with self._database.connect() as connection:
-            connection.execute(query, (status.strip(), session_id, *ids))
+        with self._database.connect_write() as connection:
+            _update_status_by_ids(connection, "bonus_records", session_id, ids, status.strip())
 
     def update_session_status(self, session_id: int, status: str) -> None:
         cleaned_status = status.strip() if status else "draft"
-        with self._database.connect() as connection:
+        with self._database.connect_write() as connection:
             connection.execute(
                 "UPDATE attendance_sessions SET status = ? WHERE id = ?",
                 (cleaned_status, session_id),
@@ -450,7 +604,7 @@ class AttendanceService:
 
     def delete_session(self, session_id: int) -> None:
         """Remove a session and all related attendance/bonus records."""
-        with self._database.connect() as connection:
+        with self._database.connect_write() as connection:
             connection.execute(
                 "DELETE FROM attendance_records WHERE session_id = ?",
                 (session_id,),
@@ -469,35 +623,27 @@ class AttendanceService:
 
         Returns True when the parent session status was updated to confirmed.
         """
-        with self._database.connect() as connection:
+        with self._database.connect_write() as connection:
             connection.execute(
-                "UPDATE attendance_records SET status = 'confirmed' WHERE session_id = ?",
-                (session_id,),
-            )
-
-            total = connection.execute(
-                "SELECT COUNT(*) FROM attendance_records WHERE session_id = ?",
-                (session_id,),
-            ).fetchone()[0]
-
-            remaining = connection.execute(
                 """
-                SELECT COUNT(*)
-                  FROM attendance_records
+                UPDATE attendance_records
+                   SET status = 'confirmed'
                  WHERE session_id = ?
                    AND status <> 'confirmed'
                 """,
                 (session_id,),
-            ).fetchone()[0]
-
-            if int(total or 0) > 0 and int(remaining or 0) == 0:
-                connection.execute(
-                    "UPDATE attendance_sessions SET status = 'confirmed' WHERE id = ?",
-                    (session_id,),
-                )
-                return True
-
-        return False
+            )
+            # Every record is confirmed now, so the session flips as long as it has any.
+            cursor = connection.execute(
+                """
+                UPDATE attendance_sessions
+                   SET status = 'confirmed'
+                 WHERE id = ?
+                   AND EXISTS (SELECT 1 FROM attendance_records WHERE session_id = ?)
+                """,
+                (session_id, session_id),
+            )
+            return cursor.rowcount > 0
 
     def create_session_template(
         self,
@@ -507,7 +653,7 @@ class AttendanceService:
         start_hour: int,
         end_hour: int,
     ) -> int:
-        with self._database.connect() as connection:
+        with self._database.connect_write() as connection:
             try:
                 cursor = connection.execute(
                     """
@@ -545,8 +691,10 @@ class AttendanceService:
             return int(cursor.lastrowid)
 
     def get_session_template(self, template_id: int) -> SessionTemplate | None:
-        with self._database.connect() as connection:
-            row = connection.execute(
+        with self._database.connect_read() as connection:
+            cursor = connection.cursor()
+            cursor.row_factory = None
+            row = cursor.execute(
                 """
                 SELECT id, campus_name, weekday_index, room_code, start_hour, end_hour
                   FROM session_templates
@@ -555,14 +703,4 @@ class AttendanceService:
                 (template_id,),
             ).fetchone()
 
-        if not row:
-            return None
-
-        return SessionTemplate(
-            id=int(row["id"]),
-            campus_name=row["campus_name"],
-            weekday_index=int(row["weekday_index"]),
-            room_code=row["room_code"],
-            start_hour=int(row["start_hour"]),
-            end_hour=int(row["end_hour"]),
-        )
+        return SessionTemplate(*row) if row else None
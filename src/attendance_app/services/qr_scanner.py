@@ -3,19 +3,29 @@ from __future__ import annotations
 import threading
 import time
 import unicodedata
+from collections import OrderedDict
 from contextlib import suppress
 from typing import Any, Callable, Optional
 
 SCAN_INTERVAL_SECONDS = 0.08
 DEDUP_INTERVAL_SECONDS = 0.8
+DEDUP_MAX_PAYLOADS = 8
 PREVIEW_INTERVAL_SECONDS = 0.07
 PREVIEW_MAX_WIDTH = 480
+DETECT_MAX_WIDTH = 720
+CAPTURE_WIDTH = 1280
+CAPTURE_HEIGHT = 720
+CAPTURE_FPS = 15
 
 
 def _decode_symbol_data(raw: bytes | str) -> str:
     if not raw:
         return ""
 
+    # Student codes are almost always ASCII, which is already NFC-normalised.
+    if raw.isascii():
+        return (raw if isinstance(raw, str) else raw.decode("ascii")).strip()
+
     if isinstance(raw, str):
         decoded = raw
     else:
@@ -28,6 +38,55 @@ def _decode_symbol_data(raw: bytes | str) -> str:
     return normalized.strip()
 
 
+class _RecentPayloads:
+    """Payloads emitted within the last DEDUP_INTERVAL_SECONDS, oldest first, capped at DEDUP_MAX_PAYLOADS."""
+
+    def __init__(self) -> None:
+        self._seen: OrderedDict[str, float] = OrderedDict()
+
+    def accept(self, payload: str, now: float) -> bool:
+        """Return True and remember ``payload`` unless it was already emitted recently."""
+
+        seen = self._seen
+        while seen:
+            timestamp = next(iter(seen.values()))
+            if now - timestamp < DEDUP_INTERVAL_SECONDS:
+                break
+            seen.popitem(last=False)
+        if payload in seen:
+            return False
+        seen[payload] = now
+        if len(seen) > DEDUP_MAX_PAYLOADS:
+            seen.popitem(last=False)
+        return True
+
+
+class _LatestFrame:
+    """Single-slot hand-off between the capture and decode threads; newer frames replace older ones."""
+
+    __slots__ = ("_condition", "_frame")
+
+    def __init__(self) -> None:
+        self._condition = threading.Condition()
+        self._frame: Any = None
+
+    def put(self, frame: Any) -> None:
+        with self._condition:
+            self._frame = frame
+            self._condition.notify()
+
+    def take(self, timeout: float) -> Any:
+        with self._condition:
+            if self._frame is None:
+                self._condition.wait(timeout)
+            frame, self._frame = self._frame, None
+            return frame
+
+    def wake(self) -> None:
+        with self._condition:
+            self._condition.notify_all()
+
+
 class QRScanner:
     def __init__(self, camera_index: int = 0) -> None:
         self._camera_index = camera_index
@@ -59,10 +118,13 @@ class QRScanner:
                     )
                 return False
 
-            self._stop_event.clear()
+            # Each run gets its own stop event, so a decoder still winding down from the
+            # previous run can never miss its stop signal when a new run starts.
+            stop_event = threading.Event()
+            self._stop_event = stop_event
 
             def _runner() -> None:
-                self._run_loop(on_payload, on_error, on_frame, cv2, zxingcpp)
+                self._run_loop(stop_event, on_payload, on_error, on_frame, cv2, zxingcpp)
 
             self._thread = threading.Thread(target=_runner, daemon=True)
             self._running = True
@@ -89,6 +151,7 @@ class QRScanner:
     # ------------------------------------------------------------------
     def _run_loop(
         self,
+        stop_event: threading.Event,
         on_payload: Callable[[str], None],
         on_error: Optional[Callable[[str], None]],
         on_frame: Optional[Callable[[Any], None]],
@@ -96,8 +159,8 @@ class QRScanner:
         zxing_module,
     ) -> None:
         capture = None
-        last_payload: Optional[str] = None
-        last_timestamp: float = 0.0
+        decoder: threading.Thread | None = None
+        latest = _LatestFrame()
         last_preview: float = 0.0
 
         try:
@@ -105,10 +168,20 @@ class QRScanner:
             if capture is None:
                 return
 
-            while not self._stop_event.is_set():
+            # Decoding runs on its own thread so a slow read_barcodes never holds back
+            # capture; it always picks up the newest frame and skips any it missed.
+            decoder = threading.Thread(
+                target=self._decode_loop,
+                args=(stop_event, latest, on_payload, cv2_module, zxing_module),
+                daemon=True,
+            )
+            decoder.start()
+
+            while not stop_event.is_set():
                 ok, frame = capture.read()
                 if not ok:
-                    time.sleep(SCAN_INTERVAL_SECONDS)
+                    if stop_event.wait(SCAN_INTERVAL_SECONDS):
+                        break
                     continue
 
                 try:
@@ -116,69 +189,105 @@ class QRScanner:
                 except Exception:
                     pass
 
+                latest.put(frame)
+
                 now = time.time()
 
                 if on_frame and (now - last_preview) >= PREVIEW_INTERVAL_SECONDS:
                     preview_frame = frame
-                    if PREVIEW_MAX_WIDTH and preview_frame.shape[1] > PREVIEW_MAX_WIDTH:
-                        scale = PREVIEW_MAX_WIDTH / float(preview_frame.shape[1])
-                        height = int(preview_frame.shape[0] * scale)
+                    width = preview_frame.shape[1]
+                    if PREVIEW_MAX_WIDTH and width > PREVIEW_MAX_WIDTH:
+                        height = int(preview_frame.shape[0] * PREVIEW_MAX_WIDTH / float(width))
                         preview_frame = cv2_module.resize(preview_frame, (PREVIEW_MAX_WIDTH, height))
                     try:
-                        on_frame(preview_frame.copy())
+                        # Every preview is a fresh array (the capture returns a new frame each read),
+                        # so the UI owns it and may convert it whenever its callback runs.
+                        on_frame(preview_frame)
                     except Exception:
                         pass
                     last_preview = now
+        finally:
+            stop_event.set()
+            latest.wake()
+            if decoder is not None:
+                decoder.join(timeout=1.0)
+            if capture is not None:
+                with suppress(Exception):
+                    capture.release()
+            with self._lock:
+                # A newer run may already own the scanner if stop() and start() ran meanwhile.
+                if self._stop_event is stop_event:
+                    self._running = False
 
+    def _decode_loop(
+        self,
+        stop_event: threading.Event,
+        latest: "_LatestFrame",
+        on_payload: Callable[[str], None],
+        cv2_module,
+        zxing_module,
+    ) -> None:
+        recent = _RecentPayloads()
+
+        while not stop_event.is_set():
+            frame = latest.take(SCAN_INTERVAL_SECONDS)
+            if frame is None:
+                continue
+
+            # Decode on a downscaled copy: ZXing's work grows with pixel count, and a QR
+            # code held up to the camera stays readable at 720px wide.
+            detect_frame = frame
+            if DETECT_MAX_WIDTH and frame.shape[1] > DETECT_MAX_WIDTH:
+                detect_height = int(frame.shape[0] * DETECT_MAX_WIDTH / float(frame.shape[1]))
                 try:
-                    decoded = zxing_module.read_barcodes(
+                    detect_frame = cv2_module.resize(
                         frame,
-                        formats=zxing_module.BarcodeFormat.QRCode,
-                        try_rotate=True,
-                        try_downscale=True,
-                        text_mode=zxing_module.TextMode.HRI,
+                        (DETECT_MAX_WIDTH, detect_height),
+                        interpolation=cv2_module.INTER_AREA,
                     )
                 except Exception:
-                    decoded = []
+                    detect_frame = frame
+
+            now = time.time()
 
-                if not decoded:
-                    time.sleep(SCAN_INTERVAL_SECONDS)
+            try:
+                # ZXing only reads luminance; handing it one channel avoids its own conversion.
+                gray_frame = cv2_module.cvtColor(detect_frame, cv2_module.COLOR_BGR2GRAY)
+                decoded = zxing_module.read_barcodes(
+                    gray_frame,
+                    formats=zxing_module.BarcodeFormat.QRCode,
+                    try_rotate=True,
+                    try_downscale=True,
+                    text_mode=zxing_module.TextMode.HRI,
+                )
+            except Exception:
+                decoded = []
+
+            for obj in decoded:
+                if hasattr(obj, "valid") and not obj.valid:
+                    continue
+                if getattr(obj, "error", None):
                     continue
-                for obj in decoded:
-                    if hasattr(obj, "valid") and not obj.valid:
-                        continue
-                    if getattr(obj, "error", None):
-                        continue
-
-                    payload_text = getattr(obj, "text", "")
-                    payload = _decode_symbol_data(payload_text)
-                    if not payload:
-                        payload_bytes = getattr(obj, "bytes", b"") or b""
-                        if not isinstance(payload_bytes, (bytes, bytearray)):
-                            payload_bytes = bytes(payload_bytes)
-                        payload = _decode_symbol_data(payload_bytes)
-                    if not payload:
-                        continue
-
-                    if last_payload == payload and (now - last_timestamp) < DEDUP_INTERVAL_SECONDS:
-                        continue
-
-                    last_payload = payload
-                    last_timestamp = now
 
-                    try:
-                        on_payload(payload)
-                    except Exception:  # pragma: no cover - guard callback faults
-                        pass
+                payload_text = getattr(obj, "text", "")
+                payload = _decode_symbol_data(payload_text)
+                if not payload:
+                    payload_bytes = getattr(obj, "bytes", b"") or b""
+                    if not isinstance(payload_bytes, (bytes, bytearray)):
+                        payload_bytes = bytes(payload_bytes)
+                    payload = _decode_symbol_data(payload_bytes)
+                if not payload:
+                    continue
 
-                time.sleep(SCAN_INTERVAL_SECONDS)
-        finally:
-            if capture is not None:
-                with suppress(Exception):
-                    capture.release()
-            self._stop_event.clear()
-            with self._lock:
-                self._running = False
+                # Several students may alternate in front of the camera; remembering only the
+                # last payload would let each swap through as a fresh scan.
+                if not recent.accept(payload, now):
+                    continue
+
+                try:
+                    on_payload(payload)
+                except Exception:  # pragma: no cover - guard callback faults
+                    pass
 
     def _open_capture(self, cv2_module, on_error: Optional[Callable[[str], None]]):
         capture = None
@@ -191,6 +300,7 @@ class QRScanner:
                 capture = cv2_module.VideoCapture(self._camera_index, backend)
 
             if capture.isOpened():
+                self._configure_capture(cv2_module, capture)
                 return capture
 
             capture.release()
@@ -200,3 +310,20 @@ class QRScanner:
             on_error("Unable to access the camera. Check that it is connected and not used by another app.")
 
         return None
+
+    @staticmethod
+    def _configure_capture(cv2_module, capture) -> None:
+        # Ask the driver for 720p at a modest frame rate with a one-frame buffer: smaller
+        # frames cost less to transfer and convert, and reads never return stale frames.
+        requested = (
+            ("CAP_PROP_FRAME_WIDTH", CAPTURE_WIDTH),
+            ("CAP_PROP_FRAME_HEIGHT", CAPTURE_HEIGHT),
+            ("CAP_PROP_FPS", CAPTURE_FPS),
+            ("CAP_PROP_BUFFERSIZE", 1),
+        )
+        for name, value in requested:
+            prop = getattr(cv2_module, name, None)
+            if prop is None:
+                continue
+            with suppress(Exception):
+                capture.set(prop, value)
@@ -1,15 +1,16 @@
 from __future__ import annotations
 
+import hashlib
 import json
 import os
-import re
-from typing import cast
+import threading
+from pathlib import Path
+from typing import Callable
 
 import tkinter.messagebox as messagebox
 from tkinter import PhotoImage
 
 import customtkinter as ctk
-from PIL import Image
 
 from attendance_app.automation import (
     AutoGradingRoutine,
@@ -30,6 +31,8 @@ from attendance_app.ui.settings_view import SettingsView
 from attendance_app.ui.theme import VS_BG
 from attendance_app.ui.utils import get_asset_path
 
+_CONFIGURE_DEBOUNCE_MS = 50
+
 class AttendanceApp:
     def __init__(self) -> None:
         super().__init__()
@@ -48,6 +51,13 @@ class AttendanceApp:
         self._root.minsize(1080, 640)
         self._root.configure(fg_color=VS_BG)
 
+        self._config_dir = os.path.join(os.path.expanduser("~"), ".lut_attendance")
+        self._window_pos_path = os.path.join(self._config_dir, "window_position.json")
+        try:
+            os.makedirs(self._config_dir, exist_ok=True)
+        except OSError:
+            pass
+
         icon_path = get_asset_path("icon.png")
 
         screen_width = self._root.winfo_screenwidth()
@@ -67,14 +77,6 @@ class AttendanceApp:
             try:
                 self._icon_photo = PhotoImage(file=str(icon_path))
                 self._root.iconphoto(True, self._icon_photo)
-
-                with Image.open(icon_path) as img:
-                    icon_image = img.convert("RGBA")
-                    config_dir = os.path.join(os.path.expanduser("~"), ".lut_attendance")
-                    os.makedirs(config_dir, exist_ok=True)
-                    ico_path = os.path.join(config_dir, "app_icon.ico")
-                    icon_image.save(ico_path, format="ICO", sizes=[(16, 16), (24, 24), (32, 32), (48, 48), (64, 64)])
-                    self._root.iconbitmap(default=ico_path)
             except Exception:
                 self._icon_photo = None
 
@@ -105,46 +107,19 @@ class AttendanceApp:
         self._content.grid_rowconfigure(0, weight=1)
         self._content.grid_columnconfigure(0, weight=1)
 
-        take_attendance_view = TakeAttendanceView(
-            self._content,
-            self._attendance_service,
-            chrome_controller=self._chrome_controller,
-            on_session_started=self._handle_session_started,
-            on_session_ended=self._handle_session_ended,
-        )
-        self._take_attendance_view = take_attendance_view
-
-        auto_grader_view = AutoGraderView(
-            self._content,
-            self._attendance_service,
-            chrome_controller=self._chrome_controller,
-            on_detail_open=self._handle_auto_grader_detail_open,
-            on_detail_close=self._handle_auto_grader_detail_close,
-        )
-
-        self._views = {
-            "take_attendance": take_attendance_view,
-            "history": ManageRecordsView(
-                self._content,
-                self._attendance_service,
-            ),
-            "auto_grader": auto_grader_view,
-            "settings": SettingsView(
-                self._content,
-                store=user_settings_store,
-                on_settings_saved=self._handle_settings_saved,
-                chrome_required=self._chrome_controller is None,
-            ),
+        # Views are built the first time they are shown; only one is visible at startup.
+        self._take_attendance_view: TakeAttendanceView | None = None
+        self._auto_grader_view: AutoGraderView | None = None
+        self._settings_view: SettingsView | None = None
+        self._grading_handler: AutoGradingRoutine | None = run_auto_grading
+        self._view_factories: dict[str, Callable[[], ctk.CTkFrame]] = {
+            "take_attendance": self._build_take_attendance_view,
+            "history": self._build_manage_records_view,
+            "auto_grader": self._build_auto_grader_view,
+            "settings": self._build_settings_view,
         }
-        self._settings_view = cast(SettingsView, self._views["settings"])
-
-        self._auto_grader_view = auto_grader_view
-
-        take_attendance_view.register_bonus_automation_handler(open_moodle_courses)
-        auto_grader_view.register_grading_handler(run_auto_grading)
-
-        for view in self._views.values():
-            view.grid(row=0, column=0, sticky="nsew")
+        self._views: dict[str, ctk.CTkFrame] = {}
+        self._current_view_key: str | None = None
 
         initial_view = "settings" if self._chrome_prompt_message else "take_attendance"
         self._show_view(initial_view)
@@ -152,27 +127,84 @@ class AttendanceApp:
 
         self._restore_window_position()
         self._root.after(0, self._maximize_window)
+        if icon_path is not None:
+            # The PNG icon above is enough for first paint; the ICO only polishes the taskbar,
+            # so hashing and encoding it happen off the Tk thread.
+            threading.Thread(target=self._ensure_ico_async, args=(icon_path,), daemon=True).start()
 
+        self._configure_after_id: str | None = None
+        self._last_geometry: tuple[int, int, int, int] | None = None
         self._root.bind("<Configure>", self._handle_window_configure)
 
         self._root.protocol("WM_DELETE_WINDOW", self._on_close)
 
     def _show_view(self, key: str) -> None:
-        for name, view in self._views.items():
-            view.grid_remove()
+        if key == self._current_view_key:
+            return
+        # Every view shares the same grid cell, so switching only restacks them instead
+        # of un-gridding and re-gridding (and re-laying out) each one.
         if key in self._views:
             view = self._views[key]
-            view.grid()
-            if key == "auto_grader":
-                self._auto_grader_view.refresh()
-            elif key == "settings":
-                self._settings_view.refresh()
-                self._handle_auto_grader_detail_close()
-            else:
-                self._handle_auto_grader_detail_close()
+        elif key in self._view_factories:
+            view = self._view_factories[key]()
+            view.grid(row=0, column=0, sticky="nsew")
+            self._views[key] = view
+        else:
+            return
+        view.tkraise()
+        self._current_view_key = key
+        if key == "auto_grader":
+            self._auto_grader_view.refresh()
+        elif key == "settings":
+            self._settings_view.refresh()
+            self._handle_auto_grader_detail_close()
+        else:
+            self._handle_auto_grader_detail_close()
+
+    def _build_take_attendance_view(self) -> TakeAttendanceView:
+        view = TakeAttendanceView(
+            self._content,
+            self._attendance_service,
+            chrome_controller=self._chrome_controller,
+            on_session_started=self._handle_session_started,
+            on_session_ended=self._handle_session_ended,
+        )
+        view.register_bonus_automation_handler(open_moodle_courses)
+        self._take_attendance_view = view
+        return view
+
+    def _build_manage_records_view(self) -> ManageRecordsView:
+        return ManageRecordsView(
+            self._content,
+            self._attendance_service,
+        )
+
+    def _build_auto_grader_view(self) -> AutoGraderView:
+        view = AutoGraderView(
+            self._content,
+            self._attendance_service,
+            chrome_controller=self._chrome_controller,
+            on_detail_open=self._handle_auto_grader_detail_open,
+            on_detail_close=self._handle_auto_grader_detail_close,
+        )
+        view.register_grading_handler(self._grading_handler)
+        self._auto_grader_view = view
+        return view
+
+    def _build_settings_view(self) -> SettingsView:
+        view = SettingsView(
+            self._content,
+            store=user_settings_store,
+            on_settings_saved=self._handle_settings_saved,
+            chrome_required=self._chrome_controller is None,
+        )
+        self._settings_view = view
+        return view
 
     def register_auto_grading_handler(self, handler: AutoGradingRoutine | None) -> None:
-        self._auto_grader_view.register_grading_handler(handler)
+        self._grading_handler = handler
+        if self._auto_grader_view is not None:
+            self._auto_grader_view.register_grading_handler(handler)
 
     def _handle_settings_saved(self, _updated: dict[str, object]) -> None:
         previous_db_path = getattr(self._database, "_db_path", None)
@@ -183,12 +215,15 @@ class AttendanceApp:
 
         database_changed = previous_db_path is None or settings.database_path != previous_db_path
         if database_changed:
+            self._database.close()
             self._database = Database(settings.database_path)
             self._attendance_service._database = self._database
             self._attendance_service.initialize()
-            self._auto_grader_view.refresh()
+            if self._auto_grader_view is not None:
+                self._auto_grader_view.refresh()
 
-        self._take_attendance_view.refresh_user_preferences()
+        if self._take_attendance_view is not None:
+            self._take_attendance_view.refresh_user_preferences()
 
         new_controller: ChromeRemoteController | None = None
         try:
@@ -200,7 +235,8 @@ class AttendanceApp:
                 title="Chrome not found",
                 message=f"{exc}\n\nUpdate the Chrome binary path in Settings to enable automation.",
             )
-            self._settings_view.notify_chrome_required(str(exc))
+            if self._settings_view is not None:
+                self._settings_view.notify_chrome_required(str(exc))
         else:
             self._chrome_prompt_message = None
 
@@ -211,8 +247,10 @@ class AttendanceApp:
                 pass
 
         self._chrome_controller = new_controller
-        self._take_attendance_view.set_chrome_controller(new_controller)
-        self._auto_grader_view.set_chrome_controller(new_controller)
+        if self._take_attendance_view is not None:
+            self._take_attendance_view.set_chrome_controller(new_controller)
+        if self._auto_grader_view is not None:
+            self._auto_grader_view.set_chrome_controller(new_controller)
 
     def _handle_session_started(self) -> None:
         self._nav.collapse()
@@ -221,7 +259,8 @@ class AttendanceApp:
     def _handle_session_ended(self) -> None:
         self._nav.set_navigation_enabled(True)
         self._nav.expand()
-        self._auto_grader_view.refresh()
+        if self._auto_grader_view is not None:
+            self._auto_grader_view.refresh()
 
     def _set_flexible_window_size(self):
         self._root.minsize(780, 640)  
@@ -239,18 +278,47 @@ class AttendanceApp:
 
     def _restore_window_position(self):
         try:
-            config_dir = os.path.join(os.path.expanduser("~"), ".lut_attendance")
-            os.makedirs(config_dir, exist_ok=True)
-            config_file = os.path.join(config_dir, "window_position.json")
-
-            if os.path.exists(config_file):
-                with open(config_file, 'r') as f:
+            if os.path.exists(self._window_pos_path):
+                with open(self._window_pos_path, 'r') as f:
                     position = json.load(f)
                     if self._is_position_on_screen(position.get('x'), position.get('y')):
                         self._root.geometry(f"{position.get('width', 1280)}x{position.get('height', 720)}+{position['x']}+{position['y']}")
         except Exception:
             pass
 
+    def _ensure_ico_async(self, icon_path: Path) -> None:
+        try:
+            ico_path = os.path.join(self._config_dir, "app_icon.ico")
+            digest_path = ico_path + ".blake2b"
+            digest = hashlib.blake2b(icon_path.read_bytes(), digest_size=16).hexdigest()
+            # The ICO encoder is slow; regenerate only when icon.png has changed.
+            if not (os.path.exists(ico_path) and self._read_text(digest_path) == digest):
+                from PIL import Image
+
+                with Image.open(icon_path) as img:
+                    icon_image = img.convert("RGBA")
+                    icon_image.save(ico_path, format="ICO", sizes=[(16, 16), (24, 24), (32, 32), (48, 48), (64, 64)])
+                with open(digest_path, 'w') as f:
+                    f.write(digest)
+            # Tk is not thread-safe: only the iconbitmap call goes back to the Tk thread.
+            self._root.after(0, lambda: self._apply_ico(ico_path))
+        except Exception:
+            pass
+
+    def _apply_ico(self, ico_path: str) -> None:
+        try:
+            self._root.iconbitmap(default=ico_path)
+        except Exception:
+            pass
+
+    @staticmethod
+    def _read_text(path: str) -> str | None:
+        try:
+            with open(path, 'r') as f:
+                return f.read()
+        except OSError:
+            return None
+
     def _is_position_on_screen(self, x, y):
         if x is None or y is None:
             return False
@@ -258,29 +326,39 @@ class AttendanceApp:
         return 0 <= x < 3000 and 0 <= y < 2000  
 
     def _handle_window_configure(self, event):
-        if hasattr(self, '_last_geometry') and self._last_geometry == self._root.geometry():
+        # Configure also fires for every child widget, and once per pixel while dragging;
+        # only the root matters, and only once the burst settles.
+        if event.widget is not self._root:
             return
+        # The event already carries the new geometry; no need to ask Tk for it again.
+        geometry = (event.width, event.height, event.x, event.y)
+        if geometry == self._last_geometry:
+            return
+        self._last_geometry = geometry
+        if self._configure_after_id is not None:
+            self._root.after_cancel(self._configure_after_id)
+        self._configure_after_id = self._root.after(_CONFIGURE_DEBOUNCE_MS, self._apply_configure_deferred)
 
-        self._last_geometry = self._root.geometry()
-
+    def _apply_configure_deferred(self) -> None:
+        self._configure_after_id = None
         if hasattr(self, 'nav_frame') and hasattr(self.nav_frame, 'refresh_layout'):
             self.nav_frame.refresh_layout()
 
     def _on_close(self):
         try:
-            config_dir = os.path.join(os.path.expanduser("~"), ".lut_attendance")
-            os.makedirs(config_dir, exist_ok=True)
-            config_file = os.path.join(config_dir, "window_position.json")
-
-            geometry = self._root.geometry()
-            matches = re.match(r'(\d+)x(\d+)\+(\d+)\+(\d+)', geometry)
-            if matches:
-                width, height, x, y = map(int, matches.groups())
-                with open(config_file, 'w') as f:
-                    json.dump({'width': width, 'height': height, 'x': x, 'y': y}, f)
+            # Tk reports "WxH+X+Y"; offsets left of/above the primary monitor come back as "+-8".
+            width_part, rest = self._root.geometry().split('x', 1)
+            height_part, x_part, y_part = rest.split('+')
+            width, height, x, y = int(width_part), int(height_part), int(x_part), int(y_part)
+            with open(self._window_pos_path, 'w') as f:
+                json.dump({'width': width, 'height': height, 'x': x, 'y': y}, f)
         except Exception:
             pass  
 
+        if self._configure_after_id is not None:
+            self._root.after_cancel(self._configure_after_id)
+            self._configure_after_id = None
+        self._database.close()
         self._root.destroy()
 
     def run(self) -> None:
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from contextlib import ExitStack
 from datetime import datetime
 import threading
 from typing import Any, Callable, Iterable
@@ -13,7 +14,9 @@ from attendance_app.automation import (
     AutoGradingSessionContext,
     ChromeAutomationError,
     ChromeRemoteController,
+    open_headless_grading,
 )
+from attendance_app.config.settings import settings
 from attendance_app.models.attendance import WEEKDAY_LABELS
 from attendance_app.services import AttendanceService
 from attendance_app.ui.utils import load_icon_image
@@ -69,6 +72,9 @@ class AutoGraderView(ctk.CTkFrame):
         self._back_icon_image, self._back_icon = load_icon_image("back.png", (18, 18))
 
         self._auto_save_var = ctk.BooleanVar(value=True)
+        self._fast_mode_var = ctk.BooleanVar(value=False)
+        self._headless_var = ctk.BooleanVar(value=settings.chrome_headless)
+        self._headless_controller: ChromeRemoteController | None = None
         self._automation_running = False
         self._stop_requested = False
         self._automation_thread: threading.Thread | None = None
@@ -455,6 +461,38 @@ class AutoGraderView(ctk.CTkFrame):
         )
         auto_save_switch.grid(row=0, column=1, sticky="w", padx=(12, 0))
 
+        ctk.CTkLabel(
+            auto_save_row,
+            text="Fast mode",
+            font=ctk.CTkFont(size=14, weight="bold"),
+            text_color=VS_TEXT,
+        ).grid(row=0, column=2, sticky="w", padx=(24, 0))
+
+        fast_mode_switch = ctk.CTkSwitch(
+            auto_save_row,
+            variable=self._fast_mode_var,
+            text="",
+            onvalue=True,
+            offvalue=False,
+        )
+        fast_mode_switch.grid(row=0, column=3, sticky="w", padx=(12, 0))
+
+        ctk.CTkLabel(
+            auto_save_row,
+            text="Headless",
+            font=ctk.CTkFont(size=14, weight="bold"),
+            text_color=VS_TEXT,
+        ).grid(row=0, column=4, sticky="w", padx=(24, 0))
+
+        headless_switch = ctk.CTkSwitch(
+            auto_save_row,
+            variable=self._headless_var,
+            text="",
+            onvalue=True,
+            offvalue=False,
+        )
+        headless_switch.grid(row=0, column=5, sticky="w", padx=(12, 0))
+
         log_title = ctk.CTkLabel(
             panel,
             text="Automation log",
@@ -588,9 +626,7 @@ class AutoGraderView(ctk.CTkFrame):
     # Session handling
     # ------------------------------------------------------------------
     def _load_sessions(self) -> None:
-        sessions = self._service.list_sessions()
-        confirmed_sessions = [session for session in sessions if (session.get("status") or "").lower() == "confirmed"]
-        self._render_session_rows(confirmed_sessions)
+        self._render_session_rows(self._service.list_sessions(status="confirmed"))
 
     def _render_session_rows(self, sessions: list[dict[str, Any]]) -> None:
         if self._session_list is None or self._empty_sessions_label is None:
@@ -1001,6 +1037,8 @@ class AutoGraderView(ctk.CTkFrame):
         self._session_context = AutoGradingSessionContext(
             prompt_callback=self._prompt_user_confirmation,
             log_callback=self._handle_streamed_log_message,
+            fast_mode=bool(self._fast_mode_var.get()),
+            headless=bool(self._headless_var.get()),
         )
         self._resolve_prompt(False)
         self._clear_log()
@@ -1016,59 +1054,22 @@ class AutoGraderView(ctk.CTkFrame):
         )
         def worker() -> None:
             try:
-                controller = self._chrome_controller
-                if controller is not None:
-                    try:
-                        controller.open_browser()
-                    except ChromeAutomationError as exc:
-                        self.after(0, lambda msg=f"Chrome launch failed: {exc}": self._handle_automation_launch_failure(msg))
-                        return
-                    except Exception as exc:  # pragma: no cover - guard unexpected issues
-                        self.after(0, lambda msg=f"Unexpected Chrome error: {exc}": self._handle_automation_launch_failure(msg))
-                        return
-
-                self.after(0, lambda: self._set_status("Auto-grading in progress…"))
-
-                for record in records_snapshot:
-                    if self._stop_requested:
-                        break
-                    record_id = int(record.get("id"))
-                    status = (record.get("status") or "").lower()
-                    if status == "graded":
-                        continue
-
-                    pause_event = self._pause_event
-                    if pause_event is not None:
-                        pause_event.wait()
-                    if self._stop_requested:
-                        break
-
-                    self._mark_record_processing(record_id, True)
-                    result = self._execute_grading_handler(record, auto_save, session_context)
-                    self._mark_record_processing(record_id, False)
+                with ExitStack() as browser_session:
+                    controller = self._chrome_controller
+                    if controller is not None:
+                        try:
+                            browser_session.enter_context(controller.session())
+                        except ChromeAutomationError as exc:
+                            self.after(0, lambda msg=f"Chrome launch failed: {exc}": self._handle_automation_launch_failure(msg))
+                            return
+                        except Exception as exc:  # pragma: no cover - guard unexpected issues
+                            self.after(0, lambda msg=f"Unexpected Chrome error: {exc}": self._handle_automation_launch_failure(msg))
+                            return
 
-                    if self._stop_requested:
-                        break
+                    self.after(0, lambda: self._set_status("Auto-grading in progress…"))
 
-                    if result:
-                        try:
-                            self._service.update_status_for_attendance_records(
-                                session_id=session_id,
-                                record_ids=[record_id],
-                                status="graded",
-                            )
-                        except Exception as exc:  # pragma: no cover - database layer should be reliable
-                            self.after(0, lambda message=f"Failed to update record: {exc}": self._set_status(message, tone="warning"))
-                            break
-
-                        for stored in self._attendance_records:
-                            if int(stored.get("id")) == record_id:
-                                stored["status"] = "graded"
-                                break
-
-                        self._refresh_record_status(record_id, "graded")
-                    else:
-                        self._refresh_record_status(record_id, record.get("status") or "recorded")
+                    browser_session.callback(self._shutdown_headless_controller)
+                    self._grade_records(records_snapshot, session_id, auto_save, session_context)
 
                 stopped_flag = self._stop_requested
                 self.after(0, lambda stopped=stopped_flag: self._on_automation_complete(stopped))
@@ -1081,6 +1082,87 @@ class AutoGraderView(ctk.CTkFrame):
         self._automation_thread = threading.Thread(target=worker, daemon=True)
         self._automation_thread.start()
 
+    def _grade_records(
+        self,
+        records_snapshot: list[dict[str, Any]],
+        session_id: int,
+        auto_save: bool,
+        session_context: AutoGradingSessionContext,
+    ) -> None:
+        pending_records = [
+            record for record in records_snapshot if (record.get("status") or "").lower() != "graded"
+        ]
+        for index, record in enumerate(pending_records):
+            if self._stop_requested:
+                break
+            record_id = int(record.get("id"))
+            next_index = index + 1
+            session_context.next_student_id = (
+                pending_records[next_index].get("student_id") or None if next_index < len(pending_records) else None
+            )
+
+            pause_event = self._pause_event
+            if pause_event is not None:
+                pause_event.wait()
+            if self._stop_requested:
+                break
+
+            self._mark_record_processing(record_id, True)
+            result = self._execute_grading_handler(record, auto_save, session_context)
+            self._mark_record_processing(record_id, False)
+
+            if session_context.headless and self._headless_controller is None and session_context.is_confirmed:
+                self._switch_to_headless(session_context)
+
+            if self._stop_requested:
+                break
+
+            if result:
+                try:
+                    self._service.update_status_for_attendance_records(
+                        session_id=session_id,
+                        record_ids=[record_id],
+                        status="graded",
+                    )
+                except Exception as exc:  # pragma: no cover - database layer should be reliable
+                    self.after(0, lambda message=f"Failed to update record: {exc}": self._set_status(message, tone="warning"))
+                    break
+
+                for stored in self._attendance_records:
+                    if int(stored.get("id")) == record_id:
+                        stored["status"] = "graded"
+                        break
+
+                self._refresh_record_status(record_id, "graded")
+            else:
+                self._refresh_record_status(record_id, record.get("status") or "recorded")
+
+    def _switch_to_headless(self, context: AutoGradingSessionContext) -> None:
+        controller = self._chrome_controller
+        if controller is None:
+            return
+        try:
+            self._headless_controller = open_headless_grading(controller, context)
+        except Exception as exc:
+            # Keep grading in the visible browser for the rest of the batch.
+            context.headless = False
+            self._handle_streamed_log_message(
+                AutoGradingMessage(f"Headless Chrome could not open the grading page: {exc}", "warning")
+            )
+            return
+        self._handle_streamed_log_message(
+            AutoGradingMessage("Continuing in headless Chrome on the confirmed grading page.", "info")
+        )
+
+    def _shutdown_headless_controller(self) -> None:
+        controller = self._headless_controller
+        self._headless_controller = None
+        if controller is not None:
+            try:
+                controller.shutdown()
+            except Exception:  # pragma: no cover - best effort
+                pass
+
     def _execute_grading_handler(
         self,
         record: dict[str, Any],
@@ -1090,7 +1172,7 @@ class AutoGraderView(ctk.CTkFrame):
         handler = self._grading_handler
         if handler is None:
             return False
-        controller = self._chrome_controller
+        controller = self._headless_controller or self._chrome_controller
         if controller is None:
             self.after(0, lambda: self._set_status("Chrome automation is not configured.", tone="warning"))
             return False
@@ -1233,6 +1315,7 @@ class AutoGraderView(ctk.CTkFrame):
             self._pause_event.set()
         self._set_status("Emergency stop requested. Wait please...", tone="warning")
         self._resolve_prompt(False)
+        self._shutdown_headless_controller()
         if self._chrome_controller is not None:
             try:
                 self._chrome_controller.shutdown()
@@ -2,7 +2,7 @@ import pytest
 
 from attendance_app.data import Database
 from attendance_app.models import AttendanceSession, BonusRecord, Student
-from attendance_app.services import AttendanceService, DuplicateAttendanceError
+from attendance_app.services import AttendanceService, DuplicateAttendanceError, DuplicateSessionError
 
 def test_record_attendance_prevents_duplicates(tmp_path):
     db_path = tmp_path / "attendance.db"
@@ -12,7 +12,6 @@ def test_record_attendance_prevents_duplicates(tmp_path):
 
     session = AttendanceSession(
         chapter_code="CS101",
-        week_number=1,
         weekday_index=1,
         start_hour=10,
         end_hour=12,
@@ -40,6 +39,57 @@ def test_record_attendance_prevents_duplicates(tmp_path):
     with pytest.raises(DuplicateAttendanceError):
         service.record_attendance(session_id, student)
 
+    with pytest.raises(DuplicateSessionError) as excinfo:
+        service.start_session(session)
+    assert excinfo.value.session_id == session_id
+
+def test_record_attendance_batch_skips_existing(tmp_path):
+    db_path = tmp_path / "attendance.db"
+    database = Database(db_path)
+    service = AttendanceService(database)
+    service.initialize()
+
+    session = AttendanceSession(
+        chapter_code="CS103",
+        weekday_index=4,
+        start_hour=10,
+        end_hour=12,
+        campus_name="Lappeenranta",
+        room_code="A102",
+    )
+    session_id = service.start_session(session)
+
+    alice = Student(student_code="2001", first_name="Alice", last_name="Example")
+    bob = Student(student_code="2002", first_name="Bob", last_name="Example")
+    carol = Student(student_code="2003")
+
+    service.record_attendance(session_id, alice)
+
+    inserted = service.record_attendance_batch(session_id, [alice, bob, carol, bob])
+    assert inserted == 2
+
+    rows = service.get_session_attendance(session_id)
+    assert sorted(row["student_id"] for row in rows) == ["2001", "2002", "2003"]
+    carol_row = next(row for row in rows if row["student_id"] == "2003")
+    assert carol_row["student_name"] is None
+    assert carol_row["t_point"] == 5
+
+    with pytest.raises(DuplicateAttendanceError):
+        service.record_attendance_batch(
+            session_id,
+            [Student(student_code="2004"), alice],
+            strict=True,
+        )
+    assert len(service.get_session_attendance(session_id)) == 3
+
+    assert service.record_attendance_batch(session_id, []) == 0
+
+    recent = service.recent_attendance_records(limit=2)
+    assert len(recent) == 2
+    assert {row.student_id for row in recent} <= {"2001", "2002", "2003"}
+    assert recent[0].chapter_code == "CS103"
+    assert recent[0].room_code == "A102"
+
 def test_record_bonus_points(tmp_path):
     db_path = tmp_path / "attendance.db"
     database = Database(db_path)
@@ -48,7 +98,6 @@ def test_record_bonus_points(tmp_path):
 
     session = AttendanceSession(
         chapter_code="CS102",
-        week_number=2,
         weekday_index=2,
         start_hour=12,
         end_hour=14,
@@ -79,7 +128,6 @@ def test_list_sessions_and_updates(tmp_path):
 
     monday_session = AttendanceSession(
         chapter_code="CS105",
-        week_number=3,
         weekday_index=1,
         start_hour=8,
         end_hour=10,
@@ -88,7 +136,6 @@ def test_list_sessions_and_updates(tmp_path):
     )
     tuesday_session = AttendanceSession(
         chapter_code="CS105",
-        week_number=3,
         weekday_index=2,
         start_hour=12,
         end_hour=14,
@@ -130,10 +177,25 @@ def test_list_sessions_and_updates(tmp_path):
     assert monday_summary["bonus_count"] == 1
     assert monday_summary["bonus_confirmed_count"] == 1
 
+    tuesday_summary = next(item for item in sessions if item["id"] == tuesday_id)
+    assert tuesday_summary["attendance_count"] == 1
+    assert tuesday_summary["attendance_confirmed_count"] == 0
+    assert tuesday_summary["bonus_count"] == 0
+    assert tuesday_summary["bonus_confirmed_count"] == 0
+
+    recent = service.recent_sessions(limit=1)
+    assert len(recent) == 1
+    assert recent[0].chapter_code == "CS105"
+
     filtered = service.list_sessions(weekday_index=1)
     assert len(filtered) == 1
     assert filtered[0]["id"] == monday_id
 
+    assert service.list_sessions(status="confirmed") == []
+    service.update_session_status(tuesday_id, "confirmed")
+    confirmed = service.list_sessions(status="confirmed")
+    assert [item["id"] for item in confirmed] == [tuesday_id]
+
     attendance_rows = service.get_session_attendance(monday_id)
     assert len(attendance_rows) == 1
     assert attendance_rows[0]["status"] == "confirmed"
@@ -153,7 +215,6 @@ def test_update_bonus_status_for_session(tmp_path):
 
     session = AttendanceSession(
         chapter_code="CS200",
-        week_number=4,
         weekday_index=3,
         start_hour=14,
         end_hour=16,
@@ -175,3 +236,70 @@ def test_update_bonus_status_for_session(tmp_path):
     bonus_rows = service.list_bonus_for_session(session_id, limit=None)
     assert len(bonus_rows) == 1
     assert bonus_rows[0]["status"] == "confirmed"
+
+def test_session_templates_round_trip(tmp_path):
+    database = Database(tmp_path / "attendance.db")
+    service = AttendanceService(database)
+    service.initialize()
+
+    template_id = service.create_session_template("Lahti", 2, "B202", 12, 14)
+    assert service.create_session_template("Lahti", 2, "B202", 12, 14) == template_id
+
+    templates = service.list_session_templates()
+    assert len(templates) == 1
+    assert templates[0] == service.get_session_template(template_id)
+    assert templates[0].display_label() == "Tuesday 12-14 · Lahti · B202"
+
+def test_status_updates_handle_large_id_lists(tmp_path):
+    database = Database(tmp_path / "attendance.db")
+    service = AttendanceService(database)
+    service.initialize()
+
+    session_id = service.start_session(
+        AttendanceSession(
+            chapter_code="CS300",
+            weekday_index=5,
+            start_hour=8,
+            end_hour=10,
+            campus_name="Lahti",
+            room_code="E1",
+        )
+    )
+    students = [Student(student_code=f"{3000 + index}") for index in range(1234)]
+    assert service.record_attendance_batch(session_id, students) == len(students)
+
+    record_ids = [row["id"] for row in service.get_session_attendance(session_id)]
+    service.update_status_for_attendance_records(
+        session_id=session_id,
+        record_ids=record_ids[:-1],
+        status="confirmed",
+    )
+
+    statuses = [row["status"] for row in service.get_session_attendance(session_id)]
+    assert statuses.count("confirmed") == len(students) - 1
+    assert statuses.count("recorded") == 1
+
+def test_confirm_attendance_for_session(tmp_path):
+    database = Database(tmp_path / "attendance.db")
+    service = AttendanceService(database)
+    service.initialize()
+
+    session_id = service.start_session(
+        AttendanceSession(
+            chapter_code="CS400",
+            weekday_index=2,
+            start_hour=10,
+            end_hour=12,
+            campus_name="Lahti",
+            room_code="F1",
+        )
+    )
+    assert service.confirm_attendance_for_session(session_id) is False
+
+    service.record_attendance_batch(session_id, [Student(student_code="4001"), Student(student_code="4002")])
+    assert service.confirm_attendance_for_session(session_id) is True
+
+    statuses = {row["status"] for row in service.get_session_attendance(session_id)}
+    assert statuses == {"confirmed"}
+    session_row = next(row for row in service.list_sessions() if row["id"] == session_id)
+    assert session_row["status"] == "confirmed"
@@ -0,0 +1,35 @@
+import pytest
+
+pytest.importorskip("selenium")
+
+
+def test_parse_search_html_handles_nested_markup_and_single_quotes():
+    from attendance_app.automation.auto_grading import _parse_search_html
+
+    html = """
+    <table id="submissions">
+      <tr>
+        <td class='cell c3 idnumber'><span class="badge"><a href="#">1234567</a></span></td>
+        <td class="cell grade">
+          <input type='text' class='quickgrade' name='quickgrade_42' value='' />
+          <input type="hidden" name="grademodified_42" value="1700000000">
+        </td>
+      </tr>
+    </table>
+    """
+
+    row = _parse_search_html(html)
+
+    assert row.idnumber == "1234567"
+    assert row.user_id == "42"
+    assert row.current_value == ""
+    assert row.grade_modified == {"42": "1700000000"}
+
+
+def test_parse_search_html_without_results_row():
+    from attendance_app.automation.auto_grading import _parse_search_html
+
+    row = _parse_search_html("<table id='submissions'><tr><td class='nothingdisplay'>No users</td></tr></table>")
+
+    assert row.idnumber == ""
+    assert row.user_id is None
@@ -0,0 +1,9 @@
+import pytest
+
+pytest.importorskip("selenium")
+
+
+def test_run_auto_grading_is_the_selenium_routine():
+    from attendance_app.automation import run_auto_grading
+
+    assert run_auto_grading.__module__.endswith("auto_grading")
@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+import time
+
+import pytest
+
+pytest.importorskip("selenium")
+pytest.importorskip("webdriver_manager")
+
+
+class _FakeSwitchTo:
+    def __init__(self, driver: "_FakeDriver") -> None:
+        self._driver = driver
+
+    def window(self, handle: str) -> None:
+        self._driver.current_window_handle = handle
+
+
+class _FakeDriver:
+    def __init__(self, tabs: dict[str, tuple[str, str]], current: str) -> None:
+        self.tabs = tabs
+        self.current_window_handle = current
+        self.switch_to = _FakeSwitchTo(self)
+
+    @property
+    def current_url(self) -> str:
+        return self.tabs[self.current_window_handle][0]
+
+    @property
+    def title(self) -> str:
+        return self.tabs[self.current_window_handle][1]
+
+    def execute_cdp_cmd(self, command: str, params: dict) -> dict:
+        assert command == "Target.getTargets"
+        return {
+            "targetInfos": [
+                {"targetId": handle, "type": "page", "url": url, "title": title}
+                for handle, (url, title) in self.tabs.items()
+            ]
+        }
+
+
+def test_find_codegrade_tab_rescans_when_cached_tab_navigated_away(tmp_path) -> None:
+    from attendance_app.automation.chrome import ChromeRemoteController
+
+    binary = tmp_path / "chrome"
+    binary.write_text("")
+    controller = ChromeRemoteController(_user_data_dir=tmp_path / "profile", _binary_path=binary)
+    driver = _FakeDriver(
+        {
+            "moodle": ("https://moodle.lut.fi/", "Moodle"),
+            "old": ("https://login.example.com/", "Sign in"),
+            "codegrade": ("https://app.codegrade.com/courses/1", "CodeGrade"),
+        },
+        current="moodle",
+    )
+    controller._driver = driver
+    controller._driver_last_verified = time.monotonic()
+    controller._codegrade_target_id = "old"
+
+    def is_codegrade(url: str, title: str) -> bool:
+        return "codegrade" in url
+
+    assert controller.find_codegrade_tab(is_codegrade) == "codegrade"
+    assert driver.current_window_handle == "codegrade"
+    assert controller._codegrade_target_id == "codegrade"
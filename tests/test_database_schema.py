@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import threading
 from pathlib import Path
 
 from attendance_app.data import Database
@@ -28,3 +29,77 @@ def test_initialize_creates_tables(tmp_path: Path) -> None:
     }
 
     assert expected_tables.issubset(tables)
+
+
+def test_connections_use_wal_journal(tmp_path: Path) -> None:
+    database = Database(tmp_path / "attendance.db")
+
+    with database.connect() as connection:
+        journal_mode = connection.execute("PRAGMA journal_mode").fetchone()[0]
+        synchronous = connection.execute("PRAGMA synchronous").fetchone()[0]
+
+    assert journal_mode == "wal"
+    assert synchronous == 1
+
+
+def test_connect_reuses_connection_until_closed(tmp_path: Path) -> None:
+    database = Database(tmp_path / "attendance.db")
+    database.initialize()
+
+    with database.connect() as first, database.connect() as nested:
+        assert first is nested
+        first.execute(
+            "INSERT INTO session_templates (campus_name, weekday_index, room_code, start_hour, end_hour)"
+            " VALUES ('Lahti', 1, 'A1', 8, 10)"
+        )
+
+    database.close()
+
+    with database.connect() as reopened:
+        assert reopened is not first
+        count = reopened.execute("SELECT COUNT(*) FROM session_templates").fetchone()[0]
+
+    assert count == 1
+
+
+def test_duplicate_lookups_use_unique_indexes(tmp_path: Path) -> None:
+    database = Database(tmp_path / "attendance.db")
+    database.initialize()
+
+    with database.connect_read() as connection:
+        session_plan = " ".join(
+            row[3]
+            for row in connection.execute(
+                "EXPLAIN QUERY PLAN SELECT id FROM attendance_sessions"
+                " WHERE chapter_code = ? AND weekday_index = ? AND start_hour = ?"
+                " AND end_hour = ? AND campus_name = ? AND room_code = ?",
+                ("CS101", 1, 8, 10, "Lahti", "A1"),
+            )
+        )
+        record_plan = " ".join(
+            row[3]
+            for row in connection.execute(
+                "EXPLAIN QUERY PLAN SELECT id FROM attendance_records WHERE session_id = ? AND student_id = ?",
+                (1, "123456"),
+            )
+        )
+
+    assert "INDEX sqlite_autoindex_attendance_sessions" in session_plan
+    assert "INDEX sqlite_autoindex_attendance_records" in record_plan
+
+
+def test_each_thread_gets_its_own_connection(tmp_path: Path) -> None:
+    database = Database(tmp_path / "attendance.db")
+    database.initialize()
+    seen: list[object] = []
+
+    def worker() -> None:
+        with database.connect_read() as connection:
+            seen.append(connection)
+
+    thread = threading.Thread(target=worker)
+    thread.start()
+    thread.join()
+
+    with database.connect_read() as connection:
+        assert seen and seen[0] is not connection
@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+from datetime import timezone
+
+from attendance_app.models import AttendanceRecord, AttendanceSession, BonusRecord, Student
+
+
+def _session() -> AttendanceSession:
+    return AttendanceSession(
+        chapter_code="CS101",
+        weekday_index=1,
+        start_hour=10,
+        end_hour=12,
+        campus_name="Lappeenranta",
+        room_code="A101",
+    )
+
+
+def test_timestamps_default_per_instance() -> None:
+    first = _session()
+    second = _session()
+
+    assert first.created_at.tzinfo is timezone.utc
+    assert first.created_at <= second.created_at
+    assert AttendanceSession.__dataclass_fields__["created_at"].default_factory is not None
+
+    record = AttendanceRecord(session_id=1, student_code="123456")
+    assert record.recorded_at.tzinfo is timezone.utc
+
+
+def test_session_tuple_matches_session_identity() -> None:
+    session = _session()
+
+    assert session.session_tuple() == ("CS101", 1, 10, 12, "Lappeenranta", "A101")
+    assert {session.session_tuple(): session}[_session().session_tuple()] is session
+
+
+def test_models_strip_text_fields_on_construction() -> None:
+    session = AttendanceSession(
+        chapter_code=" CS101 ",
+        weekday_index=1,
+        start_hour=10,
+        end_hour=12,
+        campus_name="Lappeenranta\n",
+        room_code="\tA101",
+    )
+    assert session.session_tuple() == _session().session_tuple()
+
+    assert Student(student_code=" 123456 ").student_code == "123456"
+
+    bonus = BonusRecord(session_id=1, student_name="  Bonus Student ", status="")
+    assert bonus.student_name == "Bonus Student"
+    assert bonus.status == "pending"
@@ -0,0 +1,21 @@
+from __future__ import annotations
+
+from attendance_app.services.qr_scanner import DEDUP_INTERVAL_SECONDS, _decode_symbol_data, _RecentPayloads
+
+
+def test_decode_symbol_data_handles_ascii_and_unicode() -> None:
+    assert _decode_symbol_data(b" 123456 \n") == "123456"
+    assert _decode_symbol_data(" 123456") == "123456"
+    assert _decode_symbol_data("José") == "José"
+    assert _decode_symbol_data("Jörg ".encode("utf-8")) == "Jörg"
+    assert _decode_symbol_data(b"") == ""
+
+
+def test_recent_payloads_suppresses_alternating_repeats() -> None:
+    recent = _RecentPayloads()
+
+    assert recent.accept("A", 0.0)
+    assert recent.accept("B", 0.1)
+    assert not recent.accept("A", 0.2)
+    assert not recent.accept("B", 0.3)
+    assert recent.accept("A", DEDUP_INTERVAL_SECONDS + 0.1)
@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from attendance_app.config.user_settings_store import UserSettingsStore
+
+
+def _make_store(tmp_path: Path) -> UserSettingsStore:
+    pointer_dir = tmp_path / "pointer"
+    pointer_dir.mkdir()
+    (pointer_dir / "user_settings.json").write_text(
+        '{"app_data_dir": "%s"}' % (tmp_path / "data").as_posix(), encoding="utf-8"
+    )
+    return UserSettingsStore(pointer_dir=pointer_dir)
+
+
+def test_update_persists_changes(tmp_path: Path) -> None:
+    store = _make_store(tmp_path)
+
+    updated = store.update(default_bonus_points=3)
+
+    assert updated["default_bonus_points"] == 3
+    assert UserSettingsStore(pointer_dir=store.pointer_dir).get("default_bonus_points") == 3
+
+
+def test_update_skips_write_when_unchanged(tmp_path: Path) -> None:
+    store = _make_store(tmp_path)
+    store.update(default_bonus_points=3)
+    store.settings_file.unlink()
+
+    store.update(default_bonus_points=3)
+
+    assert not store.settings_file.exists()
+
+
+def test_persist_leaves_no_temporary_files(tmp_path: Path) -> None:
+    store = _make_store(tmp_path)
+
+    store.update(default_attendance_points=4)
+
+    assert not list(tmp_path.rglob("*.tmp"))
+    assert UserSettingsStore(pointer_dir=store.pointer_dir).get("default_attendance_points") == 4
+
+
+def test_reload_picks_up_external_edits(tmp_path: Path) -> None:
+    store = _make_store(tmp_path)
+    store.update(default_bonus_points=3)
+
+    store.reload()
+    assert store.get("default_bonus_points") == 3
+
+    other = UserSettingsStore(pointer_dir=store.pointer_dir)
+    other.update(default_bonus_points=7)
+
+    store.reload()
+    assert store.get("default_bonus_points") == 7
+
+
+def test_shared_pointer_and_settings_file(tmp_path: Path) -> None:
+    pointer_dir = tmp_path / "pointer"
+    pointer_dir.mkdir()
+    (pointer_dir / "user_settings.json").write_text(
+        '{"app_data_dir": "%s"}' % pointer_dir.as_posix(), encoding="utf-8"
+    )
+    store = UserSettingsStore(pointer_dir=pointer_dir)
+    assert store.settings_file == pointer_dir / "user_settings.json"
+
+    store.update(default_bonus_points=4)
+
+    reloaded = UserSettingsStore(pointer_dir=pointer_dir)
+    assert reloaded.get("default_bonus_points") == 4
+    assert reloaded.get("app_data_dir") == str(pointer_dir)
+
+
+def test_listeners_run_only_when_values_change(tmp_path: Path) -> None:
+    store = _make_store(tmp_path)
+    calls: list[int] = []
+    store.add_listener(lambda: calls.append(store.get("default_bonus_points")))
+
+    store.update(default_bonus_points=6)
+    store.update(default_bonus_points=6)
+    store.reload()
+
+    assert calls == [6]
+
+
+def test_corrupt_settings_file_is_kept_aside(tmp_path: Path, caplog) -> None:
+    store = _make_store(tmp_path)
+    store.update(default_bonus_points=3)
+    store.settings_file.write_text('{"default_bonus_points": 3,', encoding="utf-8")
+
+    reloaded = UserSettingsStore(pointer_dir=store.pointer_dir)
+    reloaded.update(default_attendance_points=4)
+
+    backup = store.settings_file.with_name(store.settings_file.name + ".corrupt")
+    assert backup.read_text(encoding="utf-8") == '{"default_bonus_points": 3,'
+    assert "not valid JSON" in caplog.text